@@ -0,0 +1,73 @@
+"""
+Padrões de projeto comportamentais.
+
+Os módulos e as classes são carregados sob demanda, ex:
+`from app.Comportamental import IHandler` importa apenas o módulo
+chain_of_resposability.
+"""
+
+
+from .._lazy import attach
+
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    modules=(
+        'chain_of_resposability',
+        'command',
+        'iterator',
+        'mediator',
+        'memento',
+        'observer',
+        'state',
+        'strategy',
+        'template_method',
+        'visitor',
+    ),
+    exports={
+        'IHandler': 'chain_of_resposability',
+        'AbstractHandler': 'chain_of_resposability',
+        'MonkeyHandler': 'chain_of_resposability',
+        'SquirrelHandler': 'chain_of_resposability',
+        'DogHandler': 'chain_of_resposability',
+        'ICommand': 'command',
+        'LightOnCommand': 'command',
+        'ChangeColorCommand': 'command',
+        'Receiver': 'command',
+        'Invoker': 'command',
+        'AlphabeticalOrderIterator': 'iterator',
+        'WordsCollection': 'iterator',
+        'IMediator': 'mediator',
+        'ConcreteMediator': 'mediator',
+        'BaseComponent': 'mediator',
+        'Component1': 'mediator',
+        'Component2': 'mediator',
+        'IMemento': 'memento',
+        'Memento': 'memento',
+        'Originator': 'memento',
+        'Caretaker': 'memento',
+        'IObservable': 'observer',
+        'Product': 'observer',
+        'IObserver': 'observer',
+        'ClientA': 'observer',
+        'ClientB': 'observer',
+        'OrderContext': 'state',
+        'IOrderState': 'state',
+        'PaymentApproved': 'state',
+        'PaymentRejected': 'state',
+        'PaymentPending': 'state',
+        'Ordenator': 'strategy',
+        'IOrder': 'strategy',
+        'OrderAsc': 'strategy',
+        'OrderDesc': 'strategy',
+        'IDataMiner': 'template_method',
+        'PDFDataMIner': 'template_method',
+        'CSVDataMiner': 'template_method',
+        'IComponent': 'visitor',
+        'IVisitor': 'visitor',
+        'ComponentA': 'visitor',
+        'ComponentB': 'visitor',
+        'VisitorA': 'visitor',
+        'VisitorB': 'visitor',
+    },
+)
@@ -0,0 +1,54 @@
+"""
+Padrões de projeto criacionais.
+
+Os módulos e as classes são carregados sob demanda, ex:
+`from app.Criacional import Vehicle` importa apenas o módulo
+abstract_factory. Classes com o mesmo nome em mais de um módulo
+(Car, IVehicle, Motorcycle, Singleton, SingletonMeta) são acessadas
+pelo próprio módulo, ex: `app.Criacional.builder.Car`.
+"""
+
+
+from .._lazy import attach
+
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    modules=(
+        'abstract_factory',
+        'builder',
+        'factory_method',
+        'prototype',
+        'singleton',
+        'singleton_async',
+        'singleton_thread',
+    ),
+    exports={
+        'Vehicle': 'abstract_factory',
+        'ObjectPool': 'abstract_factory',
+        'PooledVehicle': 'abstract_factory',
+        'ICar': 'abstract_factory',
+        'IMotorcycle': 'abstract_factory',
+        'ICarBuilder': 'builder',
+        'CarBuilder': 'builder',
+        'FrozenCar': 'builder',
+        'CarBatch': 'builder',
+        'CarView': 'builder',
+        'BatchCarBuilder': 'builder',
+        'FrozenCarBuilder': 'builder',
+        'CarDirector': 'builder',
+        'IFactory': 'factory_method',
+        'CarFactory': 'factory_method',
+        'MotorcycleFactory': 'factory_method',
+        'FactoryRegistry': 'factory_method',
+        'Person': 'prototype',
+        'Address': 'prototype',
+        'AddressList': 'prototype',
+        'PrototypeRegistry': 'prototype',
+        'SerializedPrototype': 'prototype',
+        'SingletonManager': 'singleton',
+        'SharedSingletonMeta': 'singleton',
+        'Catalog': 'singleton',
+        'AsyncSingletonMeta': 'singleton_async',
+    },
+)
@@ -11,7 +11,17 @@ criar subcomponentes específicos.
 
 
 from __future__ import annotations
+import sys
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from threading import Lock
+from time import perf_counter
+from typing import (Callable, Dict, Generic, Iterator, List, Optional,
+                    Sequence, Set, TypeVar)
+
+
+T = TypeVar('T')
 
 
 class IVehicle(ABC):
@@ -39,6 +49,88 @@ class Vehicle(IVehicle):
         return Motorcycle()
 
 
+class ObjectPool(Generic[T]):
+    """
+    Pool thread-safe de produtos. O acquire reutiliza um objeto devolvido
+    ou cria um novo, e o release aplica o reset e guarda o objeto apenas
+    enquanto o pool estiver abaixo do max_size.
+
+    O pool registra os objetos emprestados, o release de um objeto que não
+    foi emprestado (ou já foi devolvido) levanta ValueError.
+    """
+
+    def __init__(self, create: Callable[[], T], max_size: int = 32,
+                 reset: Optional[Callable[[T], None]] = None) -> None:
+        self._create = create
+        self._reset = reset
+        self._max_size = max_size
+        self._items: List[T] = []
+        self._checked_out: Set[int] = set()
+        self._lock = Lock()
+        self.created = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def acquire(self) -> T:
+        with self._lock:
+            if self._items:
+                item = self._items.pop()
+                self._checked_out.add(id(item))
+                return item
+            self.created += 1
+        item = self._create()
+        with self._lock:
+            self._checked_out.add(id(item))
+        return item
+
+    def release(self, item: T) -> None:
+        with self._lock:
+            if id(item) not in self._checked_out:
+                raise ValueError(f"ObjectPool: {item!r} não está emprestado.")
+            self._checked_out.discard(id(item))
+        if self._reset is not None:
+            self._reset(item)
+        with self._lock:
+            if len(self._items) < self._max_size:
+                self._items.append(item)
+
+    @contextmanager
+    def borrow(self) -> Iterator[T]:
+        item = self.acquire()
+        try:
+            yield item
+        finally:
+            self.release(item)
+
+
+class PooledVehicle(IVehicle):
+    """
+    Variante do Vehicle que reutiliza os produtos através de um ObjectPool.
+    Os produtos devem ser devolvidos com o release após o uso.
+    """
+
+    def __init__(self, max_size: int = 32,
+                 reset: Optional[Callable[[object], None]] = None) -> None:
+        self.cars: ObjectPool[ICar] = ObjectPool(Car, max_size, reset)
+        self.motorcycles: ObjectPool[IMotorcycle] = ObjectPool(
+            Motorcycle, max_size, reset)
+
+    def create_carro(self) -> ICar:
+        return self.cars.acquire()
+
+    def create_moto(self) -> IMotorcycle:
+        return self.motorcycles.acquire()
+
+    def release(self, product: object) -> None:
+        if isinstance(product, ICar):
+            self.cars.release(product)
+        elif isinstance(product, IMotorcycle):
+            self.motorcycles.release(product)
+        else:
+            raise TypeError(f"PooledVehicle: produto desconhecido {product!r}.")
+
+
 class ICar(ABC):
     """
     Interface com metodos que devem ser
@@ -49,6 +141,10 @@ class ICar(ABC):
     def buscar_cliente(self, endereco_partida: str,
                        endereco_destino: str) -> dict: pass
 
+    @abstractmethod
+    def buscar_clientes(self, enderecos_partida: Sequence[str],
+                        enderecos_destino: Sequence[str]) -> Dict[str, List[str]]: pass
+
 
 class IMotorcycle(ABC):
     """
@@ -60,10 +156,29 @@ class IMotorcycle(ABC):
     def buscar_encomenda(self, endereco_partida: str,
                          endereco_destino: str) -> dict: pass
 
+    @abstractmethod
+    def buscar_encomendas(self, enderecos_partida: Sequence[str],
+                          enderecos_destino: Sequence[str]) -> Dict[str, List[str]]: pass
+
     @abstractmethod
     def pegar_assinatura(self, nome: str) -> str: pass
 
 
+def dispatch_batch(enderecos_partida: Sequence[str],
+                   enderecos_destino: Sequence[str]) -> Dict[str, List[str]]:
+    """
+    Processa um lote de viagens e retorna o resultado colunar, uma lista
+    por campo em vez de um dict por viagem.
+    """
+    if len(enderecos_partida) != len(enderecos_destino):
+        raise ValueError("Os endereços de partida e destino devem ter o mesmo tamanho.")
+
+    return {
+        'partida': list(enderecos_partida),
+        'destino': list(enderecos_destino),
+    }
+
+
 class Car(ICar):
     """
     Implementa os metodos da Interface Car.
@@ -75,6 +190,10 @@ class Car(ICar):
             'destino': endereco_destino,
         }
 
+    def buscar_clientes(self, enderecos_partida: Sequence[str],
+                        enderecos_destino: Sequence[str]) -> Dict[str, List[str]]:
+        return dispatch_batch(enderecos_partida, enderecos_destino)
+
 
 class Motorcycle(IMotorcycle):
     """
@@ -87,6 +206,10 @@ class Motorcycle(IMotorcycle):
             'destino': endereco_destino,
         }
 
+    def buscar_encomendas(self, enderecos_partida: Sequence[str],
+                          enderecos_destino: Sequence[str]) -> Dict[str, List[str]]:
+        return dispatch_batch(enderecos_partida, enderecos_destino)
+
     def pegar_assinatura(self, nome: str) -> str:
         return nome
 
@@ -108,5 +231,74 @@ def client_code(factory: IVehicle) -> None:
     """)
 
 
+def benchmark(jobs: int = 200_000, threads: int = 8) -> None:
+    """
+    Compara alocações e vazão de jobs curtos em um ThreadPool usando
+    o Vehicle padrão e o PooledVehicle. Os carros criados são contados
+    no construtor, nas duas variantes.
+    """
+    constructed: List[None] = []
+
+    class CountedCar(Car):
+        def __init__(self) -> None:
+            # list.append é atômico, não perde contagens entre threads.
+            constructed.append(None)
+
+    class CountedVehicle(Vehicle):
+        def create_carro(self) -> ICar:
+            return CountedCar()
+
+    vehicle = CountedVehicle()
+    pooled = PooledVehicle(max_size=threads)
+    pooled.cars = ObjectPool(CountedCar, threads)
+
+    def plain_job(_: int) -> dict:
+        return vehicle.create_carro().buscar_cliente('R. Teste 123', 'Rua Destino 321')
+
+    def pooled_job(_: int) -> dict:
+        car = pooled.create_carro()
+        try:
+            return car.buscar_cliente('R. Teste 123', 'Rua Destino 321')
+        finally:
+            pooled.release(car)
+
+    print(f"jobs: {jobs} | threads: {threads}")
+    for label, job in (('Vehicle', plain_job), ('PooledVehicle', pooled_job)):
+        constructed.clear()
+        with ThreadPoolExecutor(threads) as executor:
+            start = perf_counter()
+            for _ in executor.map(job, range(jobs), chunksize=256):
+                pass
+            elapsed = perf_counter() - start
+        print(f"{label:<14} {jobs / elapsed / 1e3:>8.1f} mil jobs/s | "
+              f"{len(constructed):>7} carros criados")
+
+
+def benchmark_batch(trips: int = 500_000) -> None:
+    """
+    Compara o buscar_cliente chamado em loop com o buscar_clientes colunar.
+    """
+    car = Car()
+    partidas = [f'R. Teste {i}' for i in range(trips)]
+    destinos = [f'Rua Destino {i}' for i in range(trips)]
+
+    start = perf_counter()
+    [car.buscar_cliente(p, d) for p, d in zip(partidas, destinos)]
+    loop_time = perf_counter() - start
+
+    start = perf_counter()
+    car.buscar_clientes(partidas, destinos)
+    batch_time = perf_counter() - start
+
+    print(f"viagens: {trips}")
+    for label, elapsed in (('loop buscar_cliente', loop_time),
+                           ('buscar_clientes', batch_time)):
+        print(f"{label:<28} {elapsed * 1e3:>8.1f} ms")
+
+
 if __name__ == "__main__":
     client = client_code(Vehicle())
+
+    if "--bench" in sys.argv:
+        benchmark()
+        benchmark_batch()
@@ -10,7 +10,14 @@ resultante. Os métodos do Builder geralmente suportam encadeamento.
 
 
 from __future__ import annotations
+import sys
+import tracemalloc
 from abc import ABC, abstractmethod
+from array import array
+from itertools import repeat
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from weakref import WeakValueDictionary
 
 
 class ICarBuilder(ABC):
@@ -19,6 +26,9 @@ class ICarBuilder(ABC):
     @abstractmethod
     def result(self) -> Car: pass
 
+    @abstractmethod
+    def result_many(self, n: int) -> Sequence[Car]: pass
+
     @abstractmethod
     def reset(self) -> None: pass
 
@@ -50,6 +60,16 @@ class CarBuilder(ICarBuilder):
         self.reset()
         return car
 
+    def result_many(self, n: int) -> List[Car]:
+        parts = self._car.parts
+        cars = []
+        for _ in range(n):
+            car = Car()
+            car.parts = list(parts)
+            cars.append(car)
+        self.reset()
+        return cars
+
     def set_seats(self, seats: int) -> None:
         self._car.add(('seats', seats))
 
@@ -77,11 +97,208 @@ class Car:
             print(part)
 
 
+class FrozenCar:
+    """
+    Produto Car imutável e hash-consed: configurações iguais retornam
+    sempre a mesma instância, com as tuplas de peças internadas.
+
+    As instâncias ficam na tabela apenas enquanto estão em uso (referência
+    fraca), e a tabela de peças é limpa ao passar de MAX_PARTS entradas.
+    """
+
+    __slots__ = ('parts', '__weakref__')
+
+    MAX_PARTS = 4096
+
+    _parts: Dict[tuple, tuple] = {}
+    _cars: WeakValueDictionary[Tuple[tuple, ...], FrozenCar] = WeakValueDictionary()
+
+    def __new__(cls, parts: Sequence[tuple] = ()) -> FrozenCar:
+        if len(cls._parts) > cls.MAX_PARTS:
+            cls._parts.clear()
+        parts = tuple(cls._parts.setdefault(part, part) for part in parts)
+        car = cls._cars.get(parts)
+        if car is None:
+            car = super().__new__(cls)
+            object.__setattr__(car, 'parts', parts)
+            car = cls._cars.setdefault(parts, car)
+        return car
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} é imutável.")
+
+    def __reduce__(self) -> tuple:
+        return (type(self), (self.parts,))
+
+    def list_parts(self) -> None:
+        for part in self.parts:
+            print(part)
+
+
+class CarBatch:
+    """
+    Armazenamento colunar de vários Car, com um array por peça. O motor é
+    guardado como um código da tabela engines (até 65535 tipos), e o
+    sunroof/turbo como bits. O bit SEATS indica que os assentos foram
+    definidos, então seats=0 é uma peça válida.
+    """
+
+    SUNROOF = 1
+    TURBO = 2
+    SEATS = 4
+
+    def __init__(self) -> None:
+        self.seats = array('B')
+        self.engines = array('H')
+        self.flags = array('B')
+        self._engine_names: List[Optional[str]] = [None]
+        self._engine_codes: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.seats)
+
+    def __getitem__(self, index: int) -> CarView:
+        if not -len(self) <= index < len(self):
+            raise IndexError("CarBatch: índice fora do intervalo.")
+        return CarView(self, index % len(self))
+
+    def engine_code(self, engine_type: str) -> int:
+        code = self._engine_codes.get(engine_type)
+        if code is None:
+            code = len(self._engine_names)
+            if code > 0xFFFF:
+                raise ValueError("CarBatch: limite de tipos de motor atingido.")
+            self._engine_names.append(engine_type)
+            self._engine_codes[engine_type] = code
+        return code
+
+    def engine_name(self, code: int) -> Optional[str]:
+        return self._engine_names[code]
+
+    def append(self, seats: int, engine: int, flags: int, n: int = 1) -> range:
+        """
+        Adiciona N linhas iguais e retorna o intervalo de índices criados.
+        Se um valor não couber no array, as linhas já gravadas nas outras
+        colunas são desfeitas para que elas não fiquem dessincronizadas.
+        """
+        start = len(self)
+        try:
+            self.seats.extend(repeat(seats, n))
+            self.engines.extend(repeat(engine, n))
+            self.flags.extend(repeat(flags, n))
+        except (OverflowError, TypeError):
+            for column in (self.seats, self.engines, self.flags):
+                del column[start:]
+            raise
+        return range(start, start + n)
+
+
+class CarView:
+    """
+    Visão de um Car dentro do CarBatch, as peças só são materializadas
+    quando acessadas.
+    """
+
+    __slots__ = ('_batch', '_index')
+
+    def __init__(self, batch: CarBatch, index: int) -> None:
+        self._batch = batch
+        self._index = index
+
+    @property
+    def parts(self) -> List[tuple]:
+        batch, index = self._batch, self._index
+        parts = []
+        if batch.flags[index] & CarBatch.SEATS:
+            parts.append(('seats', batch.seats[index]))
+        if batch.engines[index]:
+            parts.append(('engine', batch.engine_name(batch.engines[index])))
+        if batch.flags[index] & CarBatch.SUNROOF:
+            parts.append(('sunroof', True))
+        if batch.flags[index] & CarBatch.TURBO:
+            parts.append(('turbo', True))
+        return parts
+
+    def list_parts(self) -> None:
+        for part in self.parts:
+            print(part)
+
+
+class BatchCarBuilder(ICarBuilder):
+    """Concrete Builder que grava os Car em um CarBatch."""
+
+    def __init__(self, batch: CarBatch = None) -> None:
+        self.batch = batch if batch is not None else CarBatch()
+        self.reset()
+
+    def reset(self) -> None:
+        self._seats = 0
+        self._engine = 0
+        self._flags = 0
+
+    @property
+    def result(self) -> CarView:
+        return self.batch[self.result_many(1)[0]]
+
+    def result_many(self, n: int) -> range:
+        """
+        Grava N cópias do Car configurado e retorna os índices no batch.
+        """
+        indexes = self.batch.append(self._seats, self._engine, self._flags, n)
+        self.reset()
+        return indexes
+
+    def set_seats(self, seats: int) -> None:
+        self._seats = seats
+        self._flags |= CarBatch.SEATS
+
+    def set_engine(self, engine_type: str) -> None:
+        self._engine = self.batch.engine_code(engine_type)
+
+    def set_sunroof(self) -> None:
+        self._flags |= CarBatch.SUNROOF
+
+    def set_turbo(self) -> None:
+        self._flags |= CarBatch.TURBO
+
+
+class FrozenCarBuilder(ICarBuilder):
+    """Concrete Builder do FrozenCar."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self._parts: List[tuple] = []
+
+    @property
+    def result(self) -> FrozenCar:
+        car = FrozenCar(self._parts)
+        self.reset()
+        return car
+
+    def result_many(self, n: int) -> List[FrozenCar]:
+        return [self.result] * n
+
+    def set_seats(self, seats: int) -> None:
+        self._parts.append(('seats', seats))
+
+    def set_engine(self, engine_type: str) -> None:
+        self._parts.append(('engine', engine_type))
+
+    def set_sunroof(self) -> None:
+        self._parts.append(('sunroof', True))
+
+    def set_turbo(self) -> None:
+        self._parts.append(('turbo', True))
+
+
 class CarDirector:
     """Responsável por controlar a criação de objetos do tipo Car."""
 
     def __init__(self) -> None:
         self._builder = None
+        self._cache: Dict[Tuple[type, Callable], FrozenCar] = {}
 
     @property
     def builder(self) -> CarBuilder:
@@ -101,6 +318,90 @@ class CarDirector:
         self.builder.set_sunroof()
         self.builder.set_turbo()
 
+    def build_many(self, preset: Callable[[], None], n: int) -> Sequence:
+        """
+        Aplica o preset uma única vez e constrói N carros iguais.
+        """
+        preset()
+        return self.builder.result_many(n)
+
+    def build_cached(self, preset: Callable[[], None]):
+        """
+        Retorna o carro já construído para o preset, sem chamar o builder
+        novamente. Apenas produtos imutáveis (FrozenCar) são armazenados.
+        A chave é o próprio preset, métodos ligados são iguais quando têm o
+        mesmo objeto e a mesma função.
+        """
+        key = (type(self.builder), preset)
+        car = self._cache.get(key)
+        if car is None:
+            preset()
+            car = self.builder.result
+            if isinstance(car, FrozenCar):
+                self._cache[key] = car
+        return car
+
+
+def benchmark(cars: int = 200_000) -> None:
+    """
+    Compara memória e tempo de construção do Car com lista de tuplas
+    e do CarBatch colunar.
+    """
+    def individual() -> list:
+        director = CarDirector()
+        director.builder = CarBuilder()
+        result = []
+        for _ in range(cars):
+            director.builder_sport_car()
+            result.append(director.builder.result)
+        return result
+
+    def columnar() -> CarBatch:
+        director = CarDirector()
+        director.builder = BatchCarBuilder()
+        for _ in range(cars):
+            director.builder_sport_car()
+            director.builder.result_many(1)
+        return director.builder.batch
+
+    def columnar_many() -> CarBatch:
+        director = CarDirector()
+        director.builder = BatchCarBuilder()
+        director.build_many(director.builder_sport_car, cars)
+        return director.builder.batch
+
+    def frozen() -> list:
+        director = CarDirector()
+        director.builder = FrozenCarBuilder()
+        result = []
+        for _ in range(cars):
+            director.builder_sport_car()
+            result.append(director.builder.result)
+        return result
+
+    def frozen_cached() -> list:
+        director = CarDirector()
+        director.builder = FrozenCarBuilder()
+        return [director.build_cached(director.builder_sport_car)
+                for _ in range(cars)]
+
+    print(f"carros: {cars}")
+    for label, case in (('Car (tuplas)', individual),
+                        ('CarBatch', columnar),
+                        ('CarBatch build_many', columnar_many),
+                        ('FrozenCar', frozen),
+                        ('FrozenCar cache', frozen_cached)):
+        start = perf_counter()
+        case()
+        elapsed = perf_counter() - start
+
+        tracemalloc.start()
+        result = case()
+        memory, _peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del result
+        print(f"{label:<20} {elapsed * 1e3:>8.1f} ms | {memory / 1024 ** 2:>8.2f} MiB")
+
 
 if __name__ == "__main__":
     """Client."""
@@ -117,3 +418,6 @@ if __name__ == "__main__":
     print("Carro esportivo: ")
     director.builder_sport_car()
     builder.result.list_parts()
+
+    if "--bench" in sys.argv:
+        benchmark()
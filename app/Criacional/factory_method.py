@@ -10,7 +10,11 @@ mas os retornam como objetos de tipo ou interface abstrata.
 
 
 from __future__ import annotations
+import sys
 from abc import ABC, abstractmethod
+from importlib import import_module
+from time import perf_counter
+from typing import Dict
 
 
 class IFactory(ABC):
@@ -57,6 +61,50 @@ class MotorcycleFactory(IFactory):
         return Motorcycle()
 
 
+class FactoryRegistry:
+    """
+    Registro que mapeia o nome do produto para a sua Factory. O módulo de
+    cada Factory só é importado no primeiro pedido daquele produto.
+    """
+
+    ENTRY_POINT_GROUP = 'design_patterns.factories'
+
+    def __init__(self) -> None:
+        self._targets: Dict[str, str] = {}
+        self._factories: Dict[str, IFactory] = {}
+
+    def register(self, product: str, target: str) -> None:
+        """
+        Registra a Factory no formato 'modulo:Classe', sem importá-la.
+        """
+        self._targets[product] = target
+        self._factories.pop(product, None)
+
+    def load_entry_points(self, group: str = ENTRY_POINT_GROUP) -> None:
+        """
+        Registra as Factories publicadas por pacotes instalados
+        através de entry points.
+        """
+        # Importado aqui, o importlib.metadata é caro e só é usado por plugins.
+        from importlib.metadata import entry_points
+
+        for entry_point in entry_points(group=group):
+            self.register(entry_point.name, entry_point.value)
+
+    def __contains__(self, product: str) -> bool:
+        return product in self._targets
+
+    def get(self, product: str) -> IFactory:
+        factory = self._factories.get(product)
+        if factory is None:
+            if product not in self._targets:
+                raise KeyError(f"FactoryRegistry: produto '{product}' não registrado.")
+            module_name, _, attr = self._targets[product].partition(':')
+            factory = getattr(import_module(module_name), attr)()
+            self._factories[product] = factory
+        return factory
+
+
 class IVehicle(ABC):
     """
     Interface do produto a ser criado na Factory.
@@ -85,9 +133,67 @@ class Motorcycle(IVehicle):
         return "Transporting product with motorcycle."
 
 
+def benchmark(vehicle_types: int = 40) -> None:
+    """
+    Gera módulos de Factory temporários e compara o tempo de importar todos
+    na inicialização com o FactoryRegistry resolvendo apenas um deles.
+    """
+    import tempfile
+    from pathlib import Path
+
+    plugin = (
+        "from factory_method import IFactory, IVehicle\n"
+        "_TABLE = [str(i) * 8 for i in range(20_000)]\n"
+        "class Vehicle(IVehicle):\n"
+        "    def take_product(self) -> str:\n"
+        "        return 'Transporting product with {name}.'\n"
+        "class Factory(IFactory):\n"
+        "    def factory_method(self) -> IVehicle:\n"
+        "        return Vehicle()\n"
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        for prefix in ('eager', 'lazy'):
+            for i in range(vehicle_types):
+                name = f'{prefix}_vehicle_{i}'
+                Path(directory, f'{name}.py').write_text(plugin.format(name=name))
+        sys.path.insert(0, directory)
+        # Os plugins importam este módulo pelo nome, mesmo executado como script.
+        sys.modules.setdefault('factory_method', sys.modules[__name__])
+
+        try:
+            start = perf_counter()
+            eager = {f'vehicle_{i}': import_module(f'eager_vehicle_{i}').Factory()
+                     for i in range(vehicle_types)}
+            eager['vehicle_0'].transporting_product()
+            eager_time = perf_counter() - start
+
+            start = perf_counter()
+            registry = FactoryRegistry()
+            for i in range(vehicle_types):
+                registry.register(f'vehicle_{i}', f'lazy_vehicle_{i}:Factory')
+            registry.get('vehicle_0').transporting_product()
+            lazy_time = perf_counter() - start
+        finally:
+            sys.path.remove(directory)
+
+    print(f"tipos de veículo: {vehicle_types}")
+    print(f"importação na inicialização: {eager_time * 1e3:.1f} ms")
+    print(f"FactoryRegistry (1 produto): {lazy_time * 1e3:.1f} ms")
+
+
 if __name__ == "__main__":
     car = CarFactory()
     moto = MotorcycleFactory()
 
     print(car.transporting_product())
     print(moto.transporting_product())
+
+    registry = FactoryRegistry()
+    registry.register('car', f'{__name__}:CarFactory')
+    registry.register('motorcycle', f'{__name__}:MotorcycleFactory')
+    registry.load_entry_points()
+    print(registry.get('motorcycle').transporting_product())
+
+    if "--bench" in sys.argv:
+        benchmark()
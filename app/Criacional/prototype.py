@@ -10,26 +10,389 @@ métodos clone ou copy, etc.
 
 
 from __future__ import annotations
+import pickle
+import sys
+from collections import deque
+from collections.abc import MutableSequence
 from copy import deepcopy
+from multiprocessing import Pool
+from threading import Lock, Thread
+from time import perf_counter
+from timeit import timeit
+from typing import Deque, Dict, Iterable, List, Set
+
+
+class AddressList(MutableSequence):
+    """
+    Visão mutável da lista de endereços de um Person. Mantém a API de
+    lista (append, índice, del...) e copia a lista compartilhada apenas
+    na primeira escrita.
+    """
+
+    __slots__ = ('_owner',)
+
+    def __init__(self, owner: Person) -> None:
+        self._owner = owner
+
+    def __len__(self) -> int:
+        return len(self._owner._addres)
+
+    def __getitem__(self, index):
+        return self._owner._addres[index]
+
+    def __setitem__(self, index, value) -> None:
+        self._owner._own()[index] = value
+
+    def __delitem__(self, index) -> None:
+        del self._owner._own()[index]
+
+    def insert(self, index: int, value: Address) -> None:
+        self._owner._own().insert(index, value)
+
+    def append(self, value: Address) -> None:
+        self._owner._own().append(value)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, AddressList):
+            other = other._owner._addres
+        return self._owner._addres == other
+
+    def __repr__(self) -> str:
+        return repr(self._owner._addres)
 
 
 class Person:
+    """
+    Protótipo com __slots__ e protocolo de cópia explícito. A lista de
+    endereços é compartilhada entre os clones (copy-on-write) até que um
+    deles adicione um novo endereço.
+    """
+
+    __slots__ = ('firstname', 'lastname', '_addres', '_shared')
+
     def __init__(self, firstname: str, lastname: str) -> None:
         self.firstname = firstname
         self.lastname = lastname
-        self.addres: list[Address] = []
+        self._addres: List[Address] = []
+        self._shared = False
+
+    @property
+    def addres(self) -> AddressList:
+        return AddressList(self)
+
+    @addres.setter
+    def addres(self, addres: Iterable[Address]) -> None:
+        self._addres = list(addres)
+        self._shared = False
+
+    def _own(self) -> List[Address]:
+        """
+        Retorna a lista de endereços exclusiva deste Person, copiando-a
+        se ainda estiver compartilhada com outro clone.
+        """
+        if self._shared:
+            self._addres = list(self._addres)
+            self._shared = False
+        return self._addres
+
+    def add_address(self, address: Address) -> None:
+        self._own().append(address)
+
+    def __copy__(self) -> Person:
+        cls = type(self)
+        clone = cls.__new__(cls)
+        clone.firstname = self.firstname
+        clone.lastname = self.lastname
+        clone._addres = self._addres
+        clone._shared = self._shared = True
+        return clone
 
-    def add_address(self, address: str) -> None:
-        self.addres.append(address)
+    def __deepcopy__(self, memo: dict) -> Person:
+        # Os demais campos são imutáveis, a cópia rasa já é completa.
+        return self.__copy__()
 
     def clone(self) -> Person:
-        return deepcopy(self)
+        return self.__copy__()
+
+    def clone_many(self, n: int) -> List[Person]:
+        """
+        Produz N clones em uma única chamada, resolvendo os atributos
+        do protótipo apenas uma vez.
+        """
+        cls = type(self)
+        new = cls.__new__
+        firstname, lastname, addres = self.firstname, self.lastname, self._addres
+        self._shared = True
+
+        clones = []
+        append = clones.append
+        for _ in range(n):
+            clone = new(cls)
+            clone.firstname = firstname
+            clone.lastname = lastname
+            clone._addres = addres
+            clone._shared = True
+            append(clone)
+        return clones
 
 
 class Address:
+    """
+    Endereço imutável, pode ser compartilhado entre todos os clones.
+    """
+
+    __slots__ = ('street', 'number')
+
     def __init__(self, street: str, number: str) -> None:
-        self.street = street
-        self.number = number
+        object.__setattr__(self, 'street', street)
+        object.__setattr__(self, 'number', number)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} é imutável.")
+
+    def __reduce__(self) -> tuple:
+        return (type(self), (self.street, self.number))
+
+    def __copy__(self) -> Address:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> Address:
+        return self
+
+
+class PrototypeRegistry:
+    """
+    Registro de protótipos por nome. Cada protótipo possui um pool de clones
+    prontos, reabastecido em segundo plano quando fica abaixo da metade.
+
+    O register guarda uma cópia do protótipo: alterações posteriores no
+    objeto original não afetam os clones, para isso registre-o novamente.
+    """
+
+    def __init__(self, pool_size: int = 1024) -> None:
+        self._pool_size = pool_size
+        self._prototypes: Dict[str, Person] = {}
+        self._pools: Dict[str, Deque[Person]] = {}
+        self._refilling: Set[str] = set()
+        self._lock = Lock()
+
+    def register(self, name: str, prototype: Person) -> None:
+        template = prototype.clone()
+        self._prototypes[name] = template
+        self._pools[name] = deque(template.clone_many(self._pool_size))
+
+    def unregister(self, name: str) -> None:
+        del self._prototypes[name]
+        del self._pools[name]
+
+    def clone(self, name: str) -> Person:
+        """
+        Retorna um clone pronto do pool em O(1), clonando na hora apenas
+        se o pool estiver vazio.
+        """
+        pool = self._pools[name]
+        if len(pool) < self._pool_size // 2:
+            self._schedule_refill(name)
+        try:
+            return pool.popleft()
+        except IndexError:
+            return self._prototypes[name].clone()
+
+    def clone_many(self, name: str, n: int) -> List[Person]:
+        """
+        Retorna N clones, consumindo primeiro o pool e gerando o restante
+        em uma única chamada ao protótipo.
+        """
+        pool = self._pools[name]
+        clones = []
+        while pool and len(clones) < n:
+            try:
+                clones.append(pool.popleft())
+            except IndexError:
+                break
+        clones.extend(self._prototypes[name].clone_many(n - len(clones)))
+        self._schedule_refill(name)
+        return clones
+
+    def _schedule_refill(self, name: str) -> None:
+        with self._lock:
+            if name in self._refilling:
+                return
+            self._refilling.add(name)
+        Thread(target=self._refill, args=(name,), daemon=True).start()
+
+    def _refill(self, name: str) -> None:
+        try:
+            prototype = self._prototypes.get(name)
+            pool = self._pools.get(name)
+            if prototype is not None and pool is not None:
+                missing = self._pool_size - len(pool)
+                if missing > 0:
+                    pool.extend(prototype.clone_many(missing))
+        finally:
+            with self._lock:
+                self._refilling.discard(name)
+
+
+class SerializedPrototype:
+    """
+    Protótipo serializado uma única vez com pickle protocolo 5. Os buffers
+    out-of-band (objetos cujo __reduce_ex__ retorna um pickle.PickleBuffer,
+    ex: arrays do NumPy) ficam separados do payload, e o objeto pode ser
+    enviado aos workers sem serializar o protótipo de novo.
+    """
+
+    __slots__ = ('payload', 'buffers')
+
+    def __init__(self, prototype: Person) -> None:
+        buffers: List[pickle.PickleBuffer] = []
+        self.payload = pickle.dumps(
+            prototype, protocol=5, buffer_callback=buffers.append)
+        self.buffers = buffers
+
+    @classmethod
+    def _restore(cls, payload: bytes, buffers: List[bytes]) -> SerializedPrototype:
+        serialized = cls.__new__(cls)
+        serialized.payload = payload
+        serialized.buffers = buffers
+        return serialized
+
+    def __reduce__(self) -> tuple:
+        # O multiprocessing serializa com o protocolo padrão, que não aceita
+        # PickleBuffer, então os buffers seguem para os workers como bytes.
+        buffers = [bytes(buffer.raw()) if isinstance(buffer, pickle.PickleBuffer)
+                   else buffer for buffer in self.buffers]
+        return (type(self)._restore, (self.payload, buffers))
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.payload) + sum(
+            memoryview(buffer).nbytes for buffer in self.buffers)
+
+    def load(self) -> Person:
+        return pickle.loads(self.payload, buffers=self.buffers)
+
+
+_worker_prototypes: Dict[str, Person] = {}
+"""
+Protótipos já desserializados no processo worker.
+"""
+
+
+def install_prototypes(prototypes: Dict[str, SerializedPrototype]) -> None:
+    """
+    Initializer do Pool: desserializa cada protótipo uma única vez por worker.
+    """
+    for name, serialized in prototypes.items():
+        _worker_prototypes[name] = serialized.load()
+
+
+def clone_prototype(name: str) -> Person:
+    """
+    Clona, dentro do worker, um protótipo instalado pelo install_prototypes.
+    """
+    return _worker_prototypes[name].clone()
+
+
+def benchmark(clones: int = 100_000) -> None:
+    """
+    Compara o clone atual com o deepcopy genérico usado anteriormente.
+    """
+
+    class LegacyAddress:
+        def __init__(self, street: str, number: str) -> None:
+            self.street = street
+            self.number = number
+
+    class LegacyPerson:
+        def __init__(self, firstname: str, lastname: str) -> None:
+            self.firstname = firstname
+            self.lastname = lastname
+            self.addres = [LegacyAddress('Rua Teste', str(i)) for i in range(3)]
+
+    legacy = LegacyPerson('Gabriel', 'Vasconcelos')
+    person = Person('Gabriel', 'Vasconcelos')
+    for i in range(3):
+        person.add_address(Address('Rua Teste', str(i)))
+
+    legacy_time = timeit(lambda: deepcopy(legacy), number=clones)
+    clone_time = timeit(person.clone, number=clones)
+    print(f"clones: {clones}")
+    print(f"deepcopy: {legacy_time / clones * 1e9:.0f} ns/clone")
+    print(f"clone:    {clone_time / clones * 1e9:.0f} ns/clone "
+          f"({legacy_time / clone_time:.1f}x)")
+
+
+def benchmark_registry(clones: int = 1_000_000) -> None:
+    """
+    Vazão para 1e6 clones: clone() inline, clone_many e o PrototypeRegistry.
+    """
+    person = Person('Gabriel', 'Vasconcelos')
+    person.add_address(Address('Rua Teste', '123'))
+    registry = PrototypeRegistry(pool_size=4096)
+    registry.register('default', person)
+
+    # Todos os casos mantêm os clones vivos, como um lote real faria.
+    def inline() -> List[Person]:
+        return [person.clone() for _ in range(clones)]
+
+    def registry_clone() -> List[Person]:
+        clone = registry.clone
+        return [clone('default') for _ in range(clones)]
+
+    cases = [
+        ('clone() inline', inline),
+        ('Person.clone_many', lambda: person.clone_many(clones)),
+        ('registry.clone', registry_clone),
+        ('registry.clone_many', lambda: registry.clone_many('default', clones)),
+    ]
+    for label, case in cases:
+        start = perf_counter()
+        case()
+        elapsed = perf_counter() - start
+        print(f"{label:<20} {clones / elapsed / 1e6:.2f} M clones/s")
+
+
+def _plain_task(person: Person) -> int:
+    return len(person.clone().addres)
+
+
+def _named_task(name: str) -> int:
+    return len(clone_prototype(name).addres)
+
+
+def benchmark_transport(tasks: int = 20_000, workers: int = 4) -> None:
+    """
+    Compara o envio do protótipo em cada task (pickle padrão) com o
+    SerializedPrototype instalado uma vez por worker.
+
+    Os bytes são uma estimativa pelo tamanho serializado de cada envio.
+    Com o fork, o initargs nem é serializado (o worker herda a memória),
+    a estimativa considera o envio feito pelo spawn.
+    """
+    person = Person('Gabriel', 'Vasconcelos')
+    for i in range(50):
+        person.add_address(Address(f'Rua Teste {i}', str(i)))
+
+    plain_bytes = len(pickle.dumps(person)) * tasks
+    start = perf_counter()
+    with Pool(workers) as pool:
+        pool.map(_plain_task, [person] * tasks, chunksize=64)
+    plain_time = perf_counter() - start
+
+    serialized = SerializedPrototype(person)
+    named_bytes = serialized.nbytes * workers + len(pickle.dumps('default')) * tasks
+    start = perf_counter()
+    with Pool(workers, initializer=install_prototypes,
+              initargs=({'default': serialized},)) as pool:
+        pool.map(_named_task, ['default'] * tasks, chunksize=64)
+    named_time = perf_counter() - start
+
+    print(f"tasks: {tasks} | workers: {workers}")
+    print(f"pickle por task:     {plain_bytes / 1024:>9.0f} KiB (estimado) | "
+          f"{plain_time / tasks * 1e6:.1f} us/task")
+    print(f"SerializedPrototype: {named_bytes / 1024:>9.0f} KiB (estimado) | "
+          f"{named_time / tasks * 1e6:.1f} us/task")
 
 
 if __name__ == "__main__":
@@ -54,3 +417,8 @@ if __name__ == "__main__":
         f'Nome: {person2.firstname} - Sobrenome: {person2.lastname}')
     print(
         f'Nome: {person3.firstname} - Sobrenome: {person3.lastname}')
+
+    if "--bench" in sys.argv:
+        benchmark()
+        benchmark_registry()
+        benchmark_transport()
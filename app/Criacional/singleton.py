@@ -9,6 +9,9 @@ de criação estático, que retorna o mesmo objeto em cache.
 
 
 from __future__ import annotations
+import os
+import sys
+from typing import Dict, Optional, Sequence, Tuple
 
 
 class SingletonMeta(type):
@@ -29,11 +32,173 @@ class SingletonMeta(type):
         return cls._instances[cls]
 
 
+_shared_instances: Dict[type, object] = {}
+"""
+Instâncias criadas dentro do processo do SingletonManager.
+"""
+
+
+def _shared_instance(cls: type, args: tuple, kwargs: dict) -> object:
+    """
+    Executado no processo do SingletonManager, cria a instância apenas
+    na primeira chamada e retorna sempre a mesma para todos os processos.
+    """
+    if cls not in _shared_instances:
+        _shared_instances[cls] = type.__call__(cls, *args, **kwargs)
+    return _shared_instances[cls]
+
+
+_manager_type: Optional[type] = None
+
+
+def _singleton_manager() -> type:
+    """
+    Cria a classe SingletonManager no primeiro uso. O multiprocessing é
+    caro de importar e só é necessário para o SharedSingletonMeta anexado.
+    """
+    global _manager_type
+    if _manager_type is None:
+        from multiprocessing.managers import BaseManager
+
+        class SingletonManager(BaseManager):
+            """
+            Servidor que hospeda as instâncias compartilhadas entre os processos.
+            """
+
+        SingletonManager.__qualname__ = 'SingletonManager'
+        SingletonManager.register('shared_instance', callable=_shared_instance)
+        _manager_type = SingletonManager
+    return _manager_type
+
+
+def __getattr__(name: str):
+    if name == 'SingletonManager':
+        return _singleton_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class SharedSingletonMeta(SingletonMeta):
+    """
+    Variante opt-in do SingletonMeta para processos do mesmo host.
+
+    Enquanto nenhum SingletonManager estiver anexado, se comporta como o
+    SingletonMeta. Após o serve/attach, a instância vive apenas no processo
+    do manager e cada processo recebe um proxy para a mesma.
+    """
+
+    _manager: Optional[SingletonManager] = None
+    _owner_pid: Optional[int] = None
+
+    def __call__(cls, *args, **kwargs):
+        manager = SharedSingletonMeta._manager
+        if manager is None:
+            return super().__call__(*args, **kwargs)
+
+        if cls not in cls._instances:
+            cls._instances[cls] = manager.shared_instance(cls, args, kwargs)
+        return cls._instances[cls]
+
+    @staticmethod
+    def serve(address: Tuple = ('127.0.0.1', 0),
+              authkey: Optional[bytes] = None) -> Tuple:
+        """
+        Inicia o SingletonManager neste processo e retorna o endereço
+        que deve ser usado pelos demais processos no attach.
+        """
+        manager = _singleton_manager()(address, authkey)
+        manager.start()
+        SharedSingletonMeta._reset()
+        SharedSingletonMeta._manager = manager
+        SharedSingletonMeta._owner_pid = os.getpid()
+        return manager.address
+
+    @staticmethod
+    def attach(address: Tuple, authkey: Optional[bytes] = None) -> None:
+        """
+        Conecta o processo atual a um SingletonManager já iniciado.
+        """
+        manager = _singleton_manager()(address, authkey)
+        manager.connect()
+        SharedSingletonMeta._reset()
+        SharedSingletonMeta._manager = manager
+
+    @staticmethod
+    def detach() -> None:
+        """
+        Desconecta o processo atual, voltando ao comportamento local.
+        O manager só é encerrado pelo processo que o iniciou.
+        """
+        manager = SharedSingletonMeta._manager
+        SharedSingletonMeta._reset()
+        if manager is not None and SharedSingletonMeta._owner_pid == os.getpid():
+            manager.shutdown()
+            SharedSingletonMeta._owner_pid = None
+
+    @staticmethod
+    def _reset() -> None:
+        """
+        Descarta os proxies (ou instâncias locais) das classes compartilhadas.
+        """
+        SharedSingletonMeta._manager = None
+        for cls in list(SingletonMeta._instances):
+            if isinstance(cls, SharedSingletonMeta):
+                del SingletonMeta._instances[cls]
+
+
 class Singleton(metaclass=SingletonMeta):
     def memory_value(self) -> Singleton:
         return self
 
 
+class Catalog(metaclass=SharedSingletonMeta):
+    """
+    Singleton de leitura com custo alto de criação, usado no benchmark.
+    """
+
+    def __init__(self, size: int = 200_000) -> None:
+        self._items = [f'item-{i}' for i in range(size)]
+
+    def lookup(self, index: int) -> str:
+        return self._items[index]
+
+
+def _measure_worker(_: int) -> int:
+    """
+    Retorna quantos bytes o worker alocou para acessar o Catalog.
+    """
+    import tracemalloc
+
+    tracemalloc.start()
+    Catalog().lookup(0)
+    allocated, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated
+
+
+def benchmark(workers: Sequence[int] = (1, 2, 4, 8)) -> None:
+    """
+    Compara a memória alocada pelos workers de um Pool com o Catalog
+    local (uma cópia por processo) e compartilhado via SingletonManager.
+    """
+    from multiprocessing import Pool
+
+    print(f"{'workers':>8} | {'local (KiB/worker)':>19} | {'compartilhado (KiB/worker)':>27}")
+    for count in workers:
+        result = []
+        for shared in (False, True):
+            initargs = ()
+            if shared:
+                address = SharedSingletonMeta.serve()
+                initargs = (address,)
+            with Pool(count, initializer=SharedSingletonMeta.attach if shared else None,
+                      initargs=initargs) as pool:
+                allocated = pool.map(_measure_worker, range(count), chunksize=1)
+            if shared:
+                SharedSingletonMeta.detach()
+            result.append(sum(allocated) / count / 1024)
+        print(f"{count:>8} | {result[0]:>19.1f} | {result[1]:>27.1f}")
+
+
 if __name__ == "__main__":
     # The client code.
 
@@ -47,3 +212,6 @@ if __name__ == "__main__":
 
     else:
         print("Falha, as variáveis possuem instâncias diferentes.")
+
+    if "--bench" in sys.argv:
+        benchmark()
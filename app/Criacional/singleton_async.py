@@ -0,0 +1,136 @@
+"""
+O Singleton é um padrão de projeto criacional, que garante que
+apenas um objeto desse tipo exista e forneça um único ponto de
+acesso a ele para qualquer outro código.
+
+Identificação: O Singleton pode ser reconhecido por um método
+de criação estático, que retorna o mesmo objeto em cache.
+"""
+
+
+from __future__ import annotations
+import asyncio
+import sys
+import weakref
+from time import perf_counter
+from typing import Dict, List
+
+
+class AsyncSingletonMeta(type):
+    """
+    Metaclass usada para implementação do Singleton com asyncio.
+    """
+
+    _instances = {}
+
+    _locks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+    """
+    Trava de cada classe por event loop, as tasks concorrentes aguardam a
+    mesma inicialização sem bloquear o event loop. Um asyncio.Lock fica
+    associado ao loop em que foi usado, então cada loop tem as suas travas.
+    """
+
+    def __call__(cls, *args, **kwargs):
+        """
+        Retorna a instância já inicializada, a criação deve ser
+        feita através do await Classe.instance().
+        """
+        if cls not in cls._instances:
+            raise TypeError(
+                f"{cls.__name__} não inicializado, use 'await {cls.__name__}.instance()'.")
+        return cls._instances[cls]
+
+    async def instance(cls, *args, **kwargs):
+        """
+        Valida se já existe uma instância da classe, se não a cria e aguarda
+        o seu método initialize antes de armazená-la no dict instances.
+        """
+        instance = cls._instances.get(cls)
+        if instance is not None:
+            return instance
+
+        loop = asyncio.get_running_loop()
+        locks: Dict[type, asyncio.Lock] = cls._locks.setdefault(loop, {})
+        lock = locks.setdefault(cls, asyncio.Lock())
+        async with lock:
+            if cls not in cls._instances:
+                instance = super().__call__(*args, **kwargs)
+                initialize = getattr(instance, 'initialize', None)
+                if initialize is not None:
+                    await initialize()
+                cls._instances[cls] = instance
+        return cls._instances[cls]
+
+
+class Singleton(metaclass=AsyncSingletonMeta):
+    value: str = None
+    initializations: int = 0
+
+    def __init__(self, value: str) -> None:
+        self.value = value
+
+    async def initialize(self) -> None:
+        # O sleep está sendo utilizado para simular a abertura de conexões
+        await asyncio.sleep(0.1)
+        type(self).initializations += 1
+
+    def memory_value(self) -> Singleton:
+        return self
+
+
+async def test_singleton(value: str) -> None:
+    singleton = await Singleton.instance(value)
+    print(f'VALUE: {singleton.value} | MEMORY: {singleton.memory_value()}')
+
+
+async def benchmark(callers: int = 10_000) -> None:
+    """
+    Mede a latência de N tasks chamando instance() ao mesmo tempo, com a
+    instância ainda não criada, e o maior atraso observado no event loop.
+    """
+
+    class Pool(metaclass=AsyncSingletonMeta):
+        initializations: int = 0
+
+        async def initialize(self) -> None:
+            await asyncio.sleep(0.1)
+            type(self).initializations += 1
+
+    latencies: List[float] = []
+    lag = 0.0
+    running = True
+
+    async def heartbeat() -> None:
+        nonlocal lag
+        while running:
+            start = perf_counter()
+            await asyncio.sleep(0.001)
+            lag = max(lag, perf_counter() - start - 0.001)
+
+    async def caller() -> None:
+        start = perf_counter()
+        await Pool.instance()
+        latencies.append(perf_counter() - start)
+
+    monitor = asyncio.create_task(heartbeat())
+    await asyncio.gather(*(caller() for _ in range(callers)))
+    running = False
+    await monitor
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1e3
+    p99 = latencies[int(len(latencies) * 0.99)] * 1e3
+    print(f"callers: {callers} | inicializações: {Pool.initializations}")
+    print(f"p50: {p50:.1f} ms | p99: {p99:.1f} ms | max: {latencies[-1] * 1e3:.1f} ms")
+    print(f"maior atraso do event loop: {lag * 1e3:.1f} ms")
+
+
+async def main() -> None:
+    await asyncio.gather(test_singleton("FOO"), test_singleton("BAR"))
+
+    if "--bench" in sys.argv:
+        await benchmark()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
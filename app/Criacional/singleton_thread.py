@@ -9,7 +9,10 @@ de criação estático, que retorna o mesmo objeto em cache.
 
 
 from __future__ import annotations
+import sys
 from threading import Lock, Thread
+from time import perf_counter
+from typing import Dict, Sequence
 
 
 class SingletonMeta(type):
@@ -19,23 +22,45 @@ class SingletonMeta(type):
 
     _instances = {}
 
+    _locks: Dict[type, Lock] = {}
+    """
+    Trava individual de cada classe, assim a inicialização de um Singleton
+    lento não bloqueia a criação dos demais.
+    """
+
     _lock: Lock = Lock()
     """
-    Metodo de trava para assegurar
-    a mesma instância em todas as threads.
+    Metodo de trava para assegurar a criação de
+    uma única trava por classe em todas as threads.
     """
 
     def __call__(cls, *args, **kwargs):
         """
-        Trava a execução das demais threads e valida se já existe uma instância
-        da classe, se não armazena os valores da mesma no dict instances.
+        Caminho rápido: se a instância já foi publicada, retorna sem travar.
+        Caso contrário, trava apenas a classe em questão e valida novamente
+        (double-checked locking) antes de armazenar a instância no dict.
         """
-        with cls._lock:
+        instance = cls._instances.get(cls)
+        if instance is not None:
+            return instance
+
+        with cls._class_lock():
             if cls not in cls._instances:
                 instance = super().__call__(*args, **kwargs)
                 cls._instances[cls] = instance
         return cls._instances[cls]
 
+    def _class_lock(cls) -> Lock:
+        """
+        Retorna a trava da classe, criando a mesma sob a trava global
+        apenas no primeiro acesso.
+        """
+        lock = cls._locks.get(cls)
+        if lock is None:
+            with SingletonMeta._lock:
+                lock = cls._locks.setdefault(cls, Lock())
+        return lock
+
 
 class Singleton(metaclass=SingletonMeta):
     value: str = None
@@ -52,9 +77,64 @@ def test_singleton(value: str) -> None:
     print(f'VALUE: {singleton.value} | MEMORY: {singleton.memory_value()}')
 
 
+class _GlobalLockSingletonMeta(type):
+    """
+    Implementação anterior (trava global em toda chamada), mantida apenas
+    como referência para o benchmark.
+    """
+
+    _instances = {}
+    _lock: Lock = Lock()
+
+    def __call__(cls, *args, **kwargs):
+        with cls._lock:
+            if cls not in cls._instances:
+                instance = super().__call__(*args, **kwargs)
+                cls._instances[cls] = instance
+        return cls._instances[cls]
+
+
+def benchmark(threads: Sequence[int] = (1, 2, 4, 8, 16, 32, 64),
+              lookups: int = 20_000) -> None:
+    """
+    Mede o custo de busca da instância já criada com diversas threads
+    concorrentes, comparando a trava global com o caminho rápido.
+    """
+
+    class Locked(metaclass=_GlobalLockSingletonMeta):
+        pass
+
+    class FastPath(metaclass=SingletonMeta):
+        pass
+
+    def worker(cls: type) -> None:
+        for _ in range(lookups):
+            cls()
+
+    print(f"{'threads':>8} | {'trava global (ns)':>18} | {'caminho rápido (ns)':>20}")
+    for count in threads:
+        result = []
+        for cls in (Locked, FastPath):
+            cls()
+            workers = [Thread(target=worker, args=(cls,)) for _ in range(count)]
+            start = perf_counter()
+            for thread in workers:
+                thread.start()
+            for thread in workers:
+                thread.join()
+            elapsed = perf_counter() - start
+            result.append(elapsed / (count * lookups) * 1e9)
+        print(f"{count:>8} | {result[0]:>18.1f} | {result[1]:>20.1f}")
+
+
 if __name__ == "__main__":
 
     process1 = Thread(target=test_singleton, args=("FOO",))
     process2 = Thread(target=test_singleton, args=("BAR",))
     process1.start()
     process2.start()
+    process1.join()
+    process2.join()
+
+    if "--bench" in sys.argv:
+        benchmark()
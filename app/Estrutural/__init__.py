@@ -0,0 +1,70 @@
+"""
+Padrões de projeto estruturais.
+
+Os módulos e as classes são carregados sob demanda, ex:
+`from app.Estrutural import Target` importa apenas o módulo
+adapter. Classes com o mesmo nome em mais de um módulo (IComponent)
+são acessadas pelo próprio módulo, ex: `app.Estrutural.composite.IComponent`.
+"""
+
+
+from .._lazy import attach
+
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    modules=(
+        'adapter',
+        'bridge',
+        'composite',
+        'decorator',
+        'facade',
+        'flyweight',
+        'proxy',
+    ),
+    exports={
+        'Target': 'adapter',
+        'Adaptee': 'adapter',
+        'Adapter': 'adapter',
+        'Abstraction': 'bridge',
+        'ExtendedAbstraction': 'bridge',
+        'Implementation': 'bridge',
+        'TVImplementation': 'bridge',
+        'RadioImplementation': 'bridge',
+        'Leaf': 'composite',
+        'Composite': 'composite',
+        'Component': 'decorator',
+        'IDecorator': 'decorator',
+        'DecoratorUp': 'decorator',
+        'DecoratorLow': 'decorator',
+        'Facade': 'facade',
+        'Subsystem1': 'facade',
+        'Subsystem2': 'facade',
+        'Flyweight': 'flyweight',
+        'FlyweightFactory': 'flyweight',
+        'LRUStore': 'flyweight',
+        'WeakStore': 'flyweight',
+        'ConcurrentFlyweightFactory': 'flyweight',
+        'MappedFlyweightStore': 'flyweight',
+        'StringColumn': 'flyweight',
+        'PoliceDatabase': 'flyweight',
+        'ISubject': 'proxy',
+        'RealSubject': 'proxy',
+        'Proxy': 'proxy',
+        'HeavyTailSubject': 'proxy',
+        'CacheStats': 'proxy',
+        'TTLCache': 'proxy',
+        'DiskCacheTier': 'proxy',
+        'HedgedSubject': 'proxy',
+        'SingleFlight': 'proxy',
+        'AsyncSingleFlight': 'proxy',
+        'AccessPredictor': 'proxy',
+        'PrefetchingProxy': 'proxy',
+        'BatchingProxy': 'proxy',
+        'AsyncBatchingProxy': 'proxy',
+        'RemoteSubjectError': 'proxy',
+        'SubjectServer': 'proxy',
+        'RemoteSubject': 'proxy',
+        'AsyncProxy': 'proxy',
+    },
+)
@@ -8,8 +8,20 @@ que retorna objetos em cache em vez de criar novos.
 """
 
 
+from __future__ import annotations
 import json
-from typing import Dict, List
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from collections import OrderedDict, deque
+from threading import Barrier, Lock, Thread, local
+from time import perf_counter
+from typing import (BinaryIO, Dict, Hashable, Iterable, Iterator, List,
+                    MutableMapping, Optional, Sequence, TextIO, Tuple)
+from weakref import WeakValueDictionary
 
 
 class Flyweight():
@@ -21,12 +33,335 @@ class Flyweight():
 
     def __init__(self, shared_state: str) -> None:
         self._shared_state = shared_state
+        self._prefix: Optional[str] = None
+
+    @property
+    def prefix(self) -> str:
+        """
+        Trecho do estado intrínseco já serializado, como o mesmo nunca muda
+        o json.dumps é executado apenas no primeiro uso.
+        """
+        if self._prefix is None:
+            self._prefix = f"Flyweight: Intrínseco ({json.dumps(self._shared_state)}) | Extrínsico ("
+        return self._prefix
+
+    def render(self, unique_state: str) -> str:
+        return f"{self.prefix}{json.dumps(unique_state)})."
 
     def operation(self, unique_state: str) -> None:
-        _state = json.dumps(self._shared_state)
-        _unique_state = json.dumps(unique_state)
-        print(
-            f"Flyweight: Intrínseco ({_state}) | Extrínsico ({_unique_state}).", end="")
+        print(self.render(unique_state), end="")
+
+    def operation_many(self, unique_states: Iterable[str],
+                       file: Optional[TextIO] = None) -> None:
+        """
+        Renderiza todos os estados extrínsecos em um único buffer, uma
+        linha por estado, e o escreve com uma única chamada de write.
+        """
+        prefix, dumps = self.prefix, json.dumps
+        buffer = "\n".join([f"{prefix}{dumps(state)})." for state in unique_states])
+        (file or sys.stdout).write(buffer + "\n")
+
+
+class LRUStore(OrderedDict):
+    """
+    Armazenamento com política LRU: ao ultrapassar o max_size, descarta o
+    Flyweight acessado há mais tempo.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        super().__init__()
+        self.max_size = max_size
+
+    def get(self, key: Hashable, default: Optional[Flyweight] = None) -> Optional[Flyweight]:
+        if key not in self:
+            return default
+        self.move_to_end(key)
+        return super().__getitem__(key)
+
+    def __setitem__(self, key: Hashable, value: Flyweight) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.max_size:
+            self.popitem(last=False)
+
+
+class WeakStore(WeakValueDictionary):
+    """
+    Armazenamento por referência fraca: o Flyweight é liberado assim que
+    nenhum objeto do Client o utiliza mais.
+    """
+
+
+class MappedFlyweightStore(MutableMapping[Tuple, Flyweight]):
+    """
+    Store persistente em um arquivo mapeado em memória (mmap). Cada estado
+    intrínseco é gravado uma única vez e endereçado por um id inteiro, e
+    qualquer processo pode abrir o mesmo arquivo e ler os estados sem cópia.
+
+    Formato: cabeçalho [MAGIC][capacidade][total][fim] (uint64), a tabela
+    hash com `capacidade` slots [crc32 uint32][id + 1 uint64] (0 = vazio,
+    sondagem linear pelo crc32 do registro) e os registros [tamanho uint32][valores
+    separados por \\x1f em UTF-8]. O id é a posição do registro na área de
+    registros. Como o índice está no arquivo, abrir é O(1) e os leitores
+    enxergam as inclusões do escritor pela própria tabela mapeada.
+
+    Ao passar de metade da capacidade, o escritor regrava o arquivo com a
+    tabela em dobro (os ids não mudam) e o substitui com os.replace, os
+    leitores abertos passam a usar o novo arquivo no refresh(). O arquivo
+    aceita apenas inclusões, com um único processo escritor por vez.
+
+    Aberto como readonly, os estados inexistentes no arquivo passados ao
+    __setitem__ (pelo FlyweightFactory) ficam apenas em memória local.
+    """
+
+    MAGIC = b'FLYWGHT2'
+    SEPARATOR = '\x1f'
+    CAPACITY = 1024
+    _HEADER = struct.Struct('<8sQQQ')
+    _SLOT = struct.Struct('<IQ')
+    _LENGTH = struct.Struct('<I')
+
+    def __init__(self, path: str, readonly: bool = False) -> None:
+        self.path = path
+        self.readonly = readonly
+        if not readonly and not os.path.exists(path):
+            self._write_file(path, self.CAPACITY, b'')
+
+        self._file: Optional[BinaryIO] = None
+        self._map: Optional[mmap.mmap] = None
+        self._flyweights: Dict[int, Flyweight] = {}
+        self._local: Dict[Tuple, Flyweight] = {}
+        self._open()
+
+    @classmethod
+    def _write_file(cls, path: str, capacity: int, records: bytes) -> int:
+        """
+        Grava o arquivo com a tabela indexando os registros, retorna o total.
+        """
+        table = bytearray(capacity * cls._SLOT.size)
+        count = offset = 0
+        while offset < len(records):
+            (length,) = cls._LENGTH.unpack_from(records, offset)
+            payload = records[offset + cls._LENGTH.size:offset + cls._LENGTH.size + length]
+            crc = zlib.crc32(payload)
+            slot = crc & (capacity - 1)
+            while cls._SLOT.unpack_from(table, slot * cls._SLOT.size)[1]:
+                slot = (slot + 1) & (capacity - 1)
+            cls._SLOT.pack_into(table, slot * cls._SLOT.size, crc, offset + 1)
+            count += 1
+            offset += cls._LENGTH.size + length
+
+        with open(path, 'wb') as file:
+            file.write(cls._HEADER.pack(cls.MAGIC, capacity, count, len(records)))
+            file.write(table)
+            file.write(records)
+        return count
+
+    def _open(self) -> None:
+        file = open(self.path, 'rb' if self.readonly else 'r+b')
+        if self._file is not None:
+            self._file.close()
+        self._file = file
+        self._remap()
+        if len(self._map) < self._HEADER.size:
+            raise ValueError(f"{self.path}: arquivo de flyweights inválido.")
+        magic, self._capacity, self._count, self._end = self._HEADER.unpack_from(self._map)
+        self._base = self._HEADER.size + self._capacity * self._SLOT.size
+        if magic != self.MAGIC or len(self._map) < self._base:
+            raise ValueError(f"{self.path}: arquivo de flyweights inválido.")
+        if not self.readonly:
+            # As inclusões são sempre no fim, o seek do BufferedRandom
+            # esvaziaria o buffer de escrita a cada registro.
+            self._file.seek(self._base + self._end)
+
+    def refresh(self) -> None:
+        """
+        Reabre o arquivo se o escritor o substituiu ao crescer a tabela, ou
+        apenas o remapeia para enxergar os registros incluídos. Custa O(1).
+        """
+        if os.stat(self.path).st_ino != os.fstat(self._file.fileno()).st_ino:
+            self._open()
+        else:
+            if not self.readonly:
+                self._file.flush()
+            self._remap()
+
+    def _remap(self) -> None:
+        # O mapeamento anterior não é fechado, as views entregues por view()
+        # ainda podem referenciá-lo, ele é liberado junto com a última delas.
+        size = os.fstat(self._file.fileno()).st_size
+        self._map = mmap.mmap(self._file.fileno(), size,
+                              access=mmap.ACCESS_READ if self.readonly else mmap.ACCESS_WRITE)
+
+    def _mapped(self, stop: int) -> bool:
+        """
+        Garante que o mapeamento cobre até stop, remapeando se necessário.
+        """
+        if stop > len(self._map):
+            if not self.readonly:
+                # Registro gravado por este processo após o último mapeamento.
+                self._file.flush()
+            self._remap()
+        return stop <= len(self._map)
+
+    def _record(self, flyweight_id: int) -> Optional[memoryview]:
+        """
+        Retorna os bytes do registro, ou None se o escritor ainda não o
+        gravou por completo no arquivo.
+        """
+        offset = self._base + flyweight_id
+        if not self._mapped(offset + self._LENGTH.size):
+            return None
+        (length,) = self._LENGTH.unpack_from(self._map, offset)
+        start = offset + self._LENGTH.size
+        if not self._mapped(start + length):
+            return None
+        return memoryview(self._map)[start:start + length]
+
+    def _probe(self, payload: bytes, crc: int) -> Tuple[Optional[int], int]:
+        """
+        Sondagem linear: retorna (id, posição do slot) ou (None, posição do
+        slot vazio). O registro só é lido quando o crc32 do slot coincide.
+        """
+        mask, unpack_from = self._capacity - 1, self._SLOT.unpack_from
+        slot = crc & mask
+        while True:
+            position = self._HEADER.size + slot * self._SLOT.size
+            slot_crc, value = unpack_from(self._map, position)
+            if not value:
+                return None, position
+            if slot_crc == crc and self._record(value - 1) == payload:
+                return value - 1, position
+            slot = (slot + 1) & mask
+
+    def _find(self, payload: bytes) -> Optional[int]:
+        return self._probe(payload, zlib.crc32(payload))[0]
+
+    def close(self) -> None:
+        if not self.readonly:
+            self._file.flush()
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                # Ainda existem views, o mapeamento é liberado com elas.
+                pass
+            self._map = None
+        self._file.close()
+
+    def __enter__(self) -> MappedFlyweightStore:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _encode(self, state: Sequence[str]) -> bytes:
+        if any(self.SEPARATOR in value for value in state):
+            raise ValueError("MappedFlyweightStore: valores não podem conter \\x1f.")
+        return self.SEPARATOR.join(state).encode()
+
+    def _grow(self) -> None:
+        """
+        Regrava o arquivo com a tabela em dobro. Os registros são copiados
+        em bloco, mantendo os ids.
+        """
+        self._file.flush()
+        self._remap()
+        records = self._map[self._base:self._base + self._end]
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        self._write_file(temporary, self._capacity * 2, records)
+        os.replace(temporary, self.path)
+        self._open()
+
+    def id_for(self, shared_state: Sequence[str]) -> int:
+        """
+        Retorna o id do estado, gravando o mesmo no arquivo caso não exista.
+        """
+        payload = self._encode(shared_state)
+        crc = zlib.crc32(payload)
+        flyweight_id, position = self._probe(payload, crc)
+        if flyweight_id is None:
+            if self.readonly:
+                raise KeyError(f"MappedFlyweightStore: {tuple(shared_state)!r} não está "
+                               f"no arquivo, aberto como somente leitura.")
+            if (self._count + 1) * 2 > self._capacity:
+                self._grow()
+                position = self._probe(payload, crc)[1]
+            flyweight_id = self._end
+            self._file.write(self._LENGTH.pack(len(payload)) + payload)
+            # O slot é publicado após o registro, e o cabeçalho por último.
+            self._SLOT.pack_into(self._map, position, crc, flyweight_id + 1)
+            self._count += 1
+            self._end += self._LENGTH.size + len(payload)
+            self._HEADER.pack_into(self._map, 0, self.MAGIC, self._capacity,
+                                   self._count, self._end)
+        return flyweight_id
+
+    def view(self, flyweight_id: int) -> memoryview:
+        """
+        Retorna os bytes do estado direto do mmap, sem cópia. A view continua
+        válida após novas inclusões, que criam um novo mapeamento.
+        """
+        record = self._record(flyweight_id)
+        if record is None:
+            raise KeyError(flyweight_id)
+        return record
+
+    def state(self, flyweight_id: int) -> List[str]:
+        return bytes(self.view(flyweight_id)).decode().split(self.SEPARATOR)
+
+    def flyweight(self, flyweight_id: int) -> Flyweight:
+        """
+        Retorna o Flyweight do id, criado apenas no primeiro acesso.
+        """
+        flyweight = self._flyweights.get(flyweight_id)
+        if flyweight is None:
+            flyweight = Flyweight(self.state(flyweight_id))
+            self._flyweights[flyweight_id] = flyweight
+        return flyweight
+
+    def __getitem__(self, key: Tuple) -> Flyweight:
+        payload = self._encode(key)
+        flyweight_id = self._find(payload)
+        if flyweight_id is None:
+            flyweight = self._local.get(key)
+            if flyweight is not None:
+                return flyweight
+            if self.readonly:
+                # A tabela pode ter crescido em outro arquivo desde a abertura.
+                self.refresh()
+                flyweight_id = self._find(payload)
+            if flyweight_id is None:
+                raise KeyError(key)
+        return self.flyweight(flyweight_id)
+
+    def __setitem__(self, key: Tuple, value: Flyweight) -> None:
+        if self.readonly:
+            self._local[key] = value
+        else:
+            self._flyweights[self.id_for(key)] = value
+
+    def __delitem__(self, key: Tuple) -> None:
+        raise TypeError("MappedFlyweightStore: o arquivo aceita apenas inclusões.")
+
+    def __iter__(self) -> Iterator[Tuple]:
+        offset = 0
+        while offset < self._header()[2]:
+            record = self._record(offset)
+            if record is None:
+                break
+            yield tuple(bytes(record).decode().split(self.SEPARATOR))
+            offset += self._LENGTH.size + len(record)
+        yield from self._local
+
+    def __len__(self) -> int:
+        return self._header()[1] + len(self._local)
+
+    def _header(self) -> Tuple[int, int, int]:
+        """
+        Capacidade, total e fim atuais, lidos do mmap (atualizados pelo escritor).
+        """
+        return self._HEADER.unpack_from(self._map)[1:]
 
 
 class FlyweightFactory():
@@ -34,20 +369,27 @@ class FlyweightFactory():
     O FlyweightFactory cria e controla os objetos Flyweight. Garantindo o
     devido compartilhamento, além de controlar os acessos do Client, validando
     se o mesmo já existe, criando um novo objeto caso contrário.
-    """
 
-    _flyweights: Dict[str, Flyweight] = {}
+    Cada instância possui o seu próprio store, que define a política de
+    descarte (dict sem limite, LRUStore ou WeakStore).
+    """
 
-    def __init__(self, initial_flyweights: List) -> None:
+    def __init__(self, initial_flyweights: List,
+                 store: Optional[MutableMapping[Tuple, Flyweight]] = None,
+                 verbose: bool = True) -> None:
+        self._flyweights = store if store is not None else {}
+        self.verbose = verbose
+        self.hits = 0
+        self.misses = 0
         for state in initial_flyweights:
             self._flyweights[self.get_key(state)] = Flyweight(state)
 
-    def get_key(self, state: List) -> str:
+    def get_key(self, state: List) -> Tuple:
         """
-        Concatena os valores da lista e retorna como string.
+        Retorna os valores da lista como tupla, na mesma ordem recebida.
         """
 
-        return "_".join(sorted(state))
+        return tuple(state)
 
     def get_flyweight(self, shared_state: List) -> Flyweight:
         """
@@ -56,19 +398,94 @@ class FlyweightFactory():
         """
 
         key = self.get_key(shared_state)
+        flyweight = self._flyweights.get(key)
 
-        if not self._flyweights.get(key):
-            print("FlyweightFactory: não localizado, criando um novo...")
-            self._flyweights[key] = Flyweight(shared_state)
+        if flyweight is None:
+            self.misses += 1
+            if self.verbose:
+                print("FlyweightFactory: não localizado, criando um novo...")
+            flyweight = Flyweight(shared_state)
+            self._flyweights[key] = flyweight
         else:
-            print("FlyweightFactory: Localizado, retornando o mesmo.")
+            self.hits += 1
+            if self.verbose:
+                print("FlyweightFactory: Localizado, retornando o mesmo.")
 
-        return self._flyweights[key]
+        return flyweight
 
     def list_flyweights(self) -> None:
         count = len(self._flyweights)
         print(f"FlyweightFactory: {count} flyweights encontrados:")
-        print("\n".join(map(str, self._flyweights.keys())), end="")
+        print("\n".join("_".join(key) for key in self._flyweights.keys()), end="")
+
+
+class ConcurrentFlyweightFactory(FlyweightFactory):
+    """
+    FlyweightFactory thread-safe. A busca de um Flyweight existente não
+    trava, e a criação trava apenas a faixa (stripe) da chave, assim duas
+    threads nunca criam o mesmo Flyweight e chaves diferentes não disputam
+    a mesma trava.
+
+    Indicado para o store padrão (dict) ou o WeakStore, o LRUStore reordena
+    as chaves em toda busca e não é seguro entre threads.
+    """
+
+    def __init__(self, initial_flyweights: List,
+                 store: Optional[MutableMapping[Tuple, Flyweight]] = None,
+                 verbose: bool = True, stripes: int = 64) -> None:
+        # Contadores de hit/miss por thread, somados apenas na leitura, assim
+        # a busca sem trava não perde contagens entre threads.
+        self._local = local()
+        self._counters: List[List[int]] = []
+        self._counters_lock = Lock()
+        self._offsets = [0, 0]
+        super().__init__(initial_flyweights, store, verbose)
+        self._locks = [Lock() for _ in range(stripes)]
+
+    def _counter(self) -> List[int]:
+        try:
+            return self._local.counter
+        except AttributeError:
+            counter = self._local.counter = [0, 0]
+            with self._counters_lock:
+                self._counters.append(counter)
+            return counter
+
+    @property
+    def hits(self) -> int:
+        return self._offsets[0] + sum(counter[0] for counter in self._counters)
+
+    @hits.setter
+    def hits(self, value: int) -> None:
+        self._offsets[0] += value - self.hits
+
+    @property
+    def misses(self) -> int:
+        return self._offsets[1] + sum(counter[1] for counter in self._counters)
+
+    @misses.setter
+    def misses(self, value: int) -> None:
+        self._offsets[1] += value - self.misses
+
+    def get_flyweight(self, shared_state: List) -> Flyweight:
+        key = self.get_key(shared_state)
+        counter = self._counter()
+        flyweight = self._flyweights.get(key)
+        if flyweight is None:
+            with self._locks[hash(key) % len(self._locks)]:
+                flyweight = self._flyweights.get(key)
+                if flyweight is None:
+                    counter[1] += 1
+                    if self.verbose:
+                        print("FlyweightFactory: não localizado, criando um novo...")
+                    flyweight = Flyweight(shared_state)
+                    self._flyweights[key] = flyweight
+                    return flyweight
+
+        counter[0] += 1
+        if self.verbose:
+            print("FlyweightFactory: Localizado, retornando o mesmo.")
+        return flyweight
 
 
 def add_car_to_police_database(
@@ -85,6 +502,281 @@ def add_car_to_police_database(
     flyweight.operation([plates, owner])
 
 
+class StringColumn:
+    """
+    Coluna de strings compacta: os valores ficam em um único bytearray
+    e apenas o offset final de cada um é guardado.
+    """
+
+    def __init__(self) -> None:
+        self._data = bytearray()
+        self._ends = array('Q')
+
+    def __len__(self) -> int:
+        return len(self._ends)
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self._ends)
+        if not 0 <= index < len(self._ends):
+            raise IndexError("StringColumn: índice fora do intervalo.")
+        start = self._ends[index - 1] if index > 0 else 0
+        return self._data[start:self._ends[index]].decode()
+
+    def append(self, value: str) -> None:
+        self._data += value.encode()
+        self._ends.append(len(self._data))
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._data) + self._ends.itemsize * len(self._ends)
+
+
+class PoliceDatabase:
+    """
+    Base de carros em colunas: placas e proprietários (estado extrínseco)
+    em StringColumn e o id do Flyweight (estado intrínseco) em um array.
+    """
+
+    def __init__(self, factory: FlyweightFactory) -> None:
+        self.factory = factory
+        self.plates = StringColumn()
+        self.owners = StringColumn()
+        self.flyweight_ids = array('I')
+        self._ids: Dict[Tuple, int] = {}
+        self._flyweights: List[Flyweight] = []
+        self.rejected_lines: List[int] = []
+        """
+        Linhas do CSV ignoradas pelo ingest_csv por não terem 5 campos.
+        """
+
+    def __len__(self) -> int:
+        return len(self.flyweight_ids)
+
+    def _flyweight_id(self, shared_state: List[str]) -> int:
+        key = self.factory.get_key(shared_state)
+        flyweight_id = self._ids.get(key)
+        if flyweight_id is None:
+            flyweight_id = len(self._flyweights)
+            self._flyweights.append(self.factory.get_flyweight(shared_state))
+            self._ids[key] = flyweight_id
+        return flyweight_id
+
+    def add_car(self, plates: str, owner: str, brand: str,
+                model: str, color: str) -> int:
+        # O Flyweight é resolvido antes, se o factory ou o store falhar
+        # nenhuma coluna é alterada.
+        flyweight_id = self._flyweight_id([brand, model, color])
+        self.plates.append(plates)
+        self.owners.append(owner)
+        self.flyweight_ids.append(flyweight_id)
+        return len(self) - 1
+
+    def ingest_csv(self, lines: Iterable[str]) -> int:
+        """
+        Lê as linhas CSV (placa, proprietário, marca, modelo, cor) em
+        streaming, sem manter as linhas em memória. Linhas em branco são
+        ignoradas, e as linhas sem 5 campos têm o número registrado em
+        rejected_lines. Retorna o total de carros incluídos.
+        """
+        import csv
+
+        count = 0
+        reader = csv.reader(lines)
+        for row in reader:
+            if len(row) != 5:
+                if row:
+                    self.rejected_lines.append(reader.line_num)
+                continue
+            self.add_car(*row)
+            count += 1
+        return count
+
+    def flyweight(self, row: int) -> Flyweight:
+        return self._flyweights[self.flyweight_ids[row]]
+
+    def car(self, row: int) -> Tuple[str, str, Flyweight]:
+        return self.plates[row], self.owners[row], self.flyweight(row)
+
+    @property
+    def nbytes(self) -> int:
+        return (self.plates.nbytes + self.owners.nbytes
+                + self.flyweight_ids.itemsize * len(self.flyweight_ids))
+
+
+def benchmark(lookups: int = 10_000_000, states: int = 10_000,
+              max_size: int = 1_000) -> None:
+    """
+    Mede tempo, hit/miss e memória das políticas de armazenamento com
+    acessos seguindo uma distribuição de cauda longa (Zipf).
+    """
+    import random
+    import tracemalloc
+
+    catalog = [[f"brand{i % 50}", f"model{i}", f"color{i % 7}"] for i in range(states)]
+    weights = [1 / (rank + 1) for rank in range(states)]
+    rng = random.Random(42)
+    sample = rng.choices(catalog, weights, k=min(lookups, 200_000))
+
+    def run(store: MutableMapping, count: int) -> FlyweightFactory:
+        factory = FlyweightFactory([], store=store, verbose=False)
+        # Mantém referenciados os flyweights dos carros "vivos" mais recentes.
+        alive = deque(maxlen=max_size)
+        get_flyweight = factory.get_flyweight
+        for i in range(count):
+            alive.append(get_flyweight(sample[i % len(sample)]))
+        return factory
+
+    print(f"lookups: {lookups} | estados distintos: {states}")
+    for label, store_type in (('dict', dict),
+                              (f'LRUStore({max_size})', lambda: LRUStore(max_size)),
+                              ('WeakStore', WeakStore)):
+        start = perf_counter()
+        factory = run(store_type(), lookups)
+        elapsed = perf_counter() - start
+
+        tracemalloc.start()
+        retained = run(store_type(), len(sample))
+        memory, _peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del retained
+
+        print(f"{label:<16} {elapsed / lookups * 1e9:>6.0f} ns/lookup | "
+              f"hit {factory.hits / lookups:>6.1%} | "
+              f"{len(factory._flyweights):>6} flyweights | {memory / 1024:>8.0f} KiB")
+
+
+def benchmark_threads(threads: Sequence[int] = (1, 2, 4, 8, 16),
+                      lookups: int = 200_000, states: int = 5_000) -> None:
+    """
+    Várias threads ingerindo os mesmos carros ao mesmo tempo: compara a
+    vazão e quantos Flyweights foram criados (o ideal é um por estado).
+    """
+    catalog = [[f"brand{i % 50}", f"model{i}", f"color{i % 7}"] for i in range(states)]
+    # Intervalo curto de troca de threads para expor a condição de corrida.
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    print(f"{'threads':>8} | {'factory':<26} | {'lookups/s':>10} | {'criados':>8}")
+    try:
+        for count in threads:
+            for factory_type in (FlyweightFactory, ConcurrentFlyweightFactory):
+                factory = factory_type([], verbose=False)
+                barrier = Barrier(count)
+                seen: List[set] = [set() for _ in range(count)]
+
+                def worker(instances: set) -> None:
+                    barrier.wait()
+                    for i in range(lookups // count):
+                        instances.add(id(factory.get_flyweight(catalog[i % states])))
+
+                workers = [Thread(target=worker, args=(instances,)) for instances in seen]
+                start = perf_counter()
+                for thread in workers:
+                    thread.start()
+                for thread in workers:
+                    thread.join()
+                elapsed = perf_counter() - start
+                print(f"{count:>8} | {factory_type.__name__:<26} | "
+                      f"{lookups / elapsed:>10.0f} | {len(set().union(*seen)):>8}")
+    finally:
+        sys.setswitchinterval(interval)
+
+
+def benchmark_mapped(states: int = 1_000_000) -> None:
+    """
+    Compara reconstruir o FlyweightFactory em memória com o warm start
+    de um MappedFlyweightStore já gravado.
+    """
+    import tempfile
+
+    catalog = [[f"brand{i % 50}", f"model{i}", f"color{i % 7}"] for i in range(states)]
+
+    start = perf_counter()
+    factory = FlyweightFactory(catalog, verbose=False)
+    rebuild_time = perf_counter() - start
+    del factory
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'flyweights.bin')
+        start = perf_counter()
+        with MappedFlyweightStore(path) as store:
+            for state in catalog:
+                store.id_for(state)
+        write_time = perf_counter() - start
+
+        start = perf_counter()
+        with MappedFlyweightStore(path, readonly=True) as store:
+            warm_time = perf_counter() - start
+            factory = FlyweightFactory([], store=store, verbose=False)
+            factory.get_flyweight(catalog[-1])
+            size = os.path.getsize(path)
+
+    print(f"estados: {states} | arquivo: {size / 1024 ** 2:.1f} MiB")
+    print(f"reconstrução em memória: {rebuild_time * 1e3:>8.1f} ms")
+    print(f"gravação no arquivo:     {write_time * 1e3:>8.1f} ms")
+    print(f"warm start do arquivo:   {warm_time * 1e3:>8.1f} ms")
+
+
+def benchmark_ingest(rows: int = 1_000_000) -> None:
+    """
+    Ingestão em streaming de N linhas CSV geradas sob demanda. Para 50M
+    linhas, chame benchmark_ingest(50_000_000).
+    """
+    def lines() -> Iterator[str]:
+        for i in range(rows):
+            yield f"CL{i:07d},Owner {i},brand{i % 50},model{i % 300},color{i % 7}\n"
+
+    def rss() -> int:
+        # RSS atual (não o pico do processo), o /proc existe apenas no Linux.
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+    before = rss()
+    database = PoliceDatabase(FlyweightFactory([], verbose=False))
+    start = perf_counter()
+    database.ingest_csv(lines())
+    elapsed = perf_counter() - start
+    after = rss()
+
+    print(f"linhas: {rows} | flyweights: {len(database._flyweights)}")
+    print(f"vazão: {rows / elapsed / 1e3:.0f} mil linhas/s")
+    print(f"colunas: {database.nbytes / rows:.1f} bytes/linha | "
+          f"RSS: +{(after - before) / 1024 ** 2:.1f} MiB "
+          f"({(after - before) / rows:.1f} bytes/linha)")
+
+
+def benchmark_operation(cars: int = 1_000_000) -> None:
+    """
+    Compara o json.dumps do estado intrínseco em toda chamada com o
+    prefixo em cache e o operation_many escrevendo um único buffer.
+    """
+    flyweight = Flyweight(["BMW", "M5", "red"])
+    unique_states = [[f"CL{i:07d}", f"Owner {i}"] for i in range(cars)]
+
+    with open(os.devnull, 'w') as devnull:
+        start = perf_counter()
+        for state in unique_states:
+            print(f"Flyweight: Intrínseco ({json.dumps(flyweight._shared_state)}) | "
+                  f"Extrínsico ({json.dumps(state)}).", end="", file=devnull)
+        legacy_time = perf_counter() - start
+
+        start = perf_counter()
+        for state in unique_states:
+            print(flyweight.render(state), end="", file=devnull)
+        cached_time = perf_counter() - start
+
+        start = perf_counter()
+        flyweight.operation_many(unique_states, devnull)
+        many_time = perf_counter() - start
+
+    print(f"carros: {cars}")
+    for label, elapsed in (('json.dumps por chamada', legacy_time),
+                           ('prefixo em cache', cached_time),
+                           ('operation_many', many_time)):
+        print(f"{label:<24} {elapsed / cars * 1e9:>6.0f} ns/carro")
+
+
 if __name__ == "__main__":
     """
     Simula o Client Code que interage e popula o Flyweight com dados.
@@ -109,3 +801,10 @@ if __name__ == "__main__":
     print("\n")
 
     factory.list_flyweights()
+
+    if "--bench" in sys.argv:
+        benchmark()
+        benchmark_threads()
+        benchmark_mapped()
+        benchmark_ingest()
+        benchmark_operation()
@@ -11,9 +11,20 @@ menos que o proxy seja uma subclasse de um serviço.
 """
 
 
+from __future__ import annotations
+import itertools
+import json
+import os
+import random
+import struct
+import sys
 from abc import ABC, abstractmethod
-from typing import List, Dict
-from time import sleep
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from threading import Barrier, Lock, Thread, Timer
+from typing import (Any, Awaitable, BinaryIO, Callable, Dict, Hashable, Iterable,
+                    Iterator, List, Optional, Sequence, Set, Tuple, Union)
+from time import monotonic, perf_counter, sleep, time
 
 
 class ISubject(ABC):
@@ -30,6 +41,10 @@ class ISubject(ABC):
     def get_user_data(self, id: int) -> Dict:
         pass
 
+    @abstractmethod
+    def get_many(self, ids: Sequence[int]) -> List[Dict]:
+        pass
+
 
 class RealSubject(ISubject):
     """
@@ -46,19 +61,528 @@ class RealSubject(ISubject):
         {'name': 'user 3', 'age': 22},
     ]
 
-    def __init__(self) -> None:
+    def __init__(self, latency: float = 2) -> None:
         self._log = []
+        self.latency = latency
+        self.calls = 0
 
     def get_all(self) -> List[Dict]:
+        self.calls += 1
       # O sleep está sendo utilizado para simular um processo pesado
-        sleep(2)
+        sleep(self.latency)
         return self._data
 
     def get_user_data(self, id: int) -> Dict:
+        self.calls += 1
       # O sleep está sendo utilizado para simular um processo pesado
-        sleep(2)
+        sleep(self.latency)
         return self._data[id]
 
+    def get_many(self, ids: Sequence[int]) -> List[Dict]:
+        self.calls += 1
+      # Uma única ida ao serviço para todos os ids
+        sleep(self.latency)
+        return [self._data[id] for id in ids]
+
+
+class HeavyTailSubject(RealSubject):
+    """
+    RealSubject simulado com latência de cauda longa (Pareto): a maioria
+    das chamadas leva cerca de `latency`, mas algumas levam muito mais.
+    """
+
+    def __init__(self, latency: float = 0.01, alpha: float = 1.5,
+                 max_latency: float = 2, seed: Optional[int] = None) -> None:
+        super().__init__(latency)  # grava o _base_latency pelo setter
+        self.alpha = alpha
+        self.max_latency = max_latency
+        self._random = random.Random(seed)
+
+    @property
+    def latency(self) -> float:
+        return min(self._base_latency * self._random.paretovariate(self.alpha),
+                   self.max_latency)
+
+    @latency.setter
+    def latency(self, value: float) -> None:
+        self._base_latency = value
+
+
+_MISSING = object()
+
+
+class CacheStats:
+    """
+    Contadores de acerto/erro do cache e o tempo gasto nas cargas.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.load_time = 0.0
+        self.stale_serves = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def miss_latency(self) -> float:
+        """
+        Latência média (s) das cargas feitas no RealSubject. Os misses
+        agrupados pelo single flight não fazem carga e não entram na média.
+        """
+        return self.load_time / self.loads if self.loads else 0.0
+
+    def __repr__(self) -> str:
+        return (f"CacheStats(hits={self.hits}, misses={self.misses}, loads={self.loads}, "
+                f"hit_rate={self.hit_rate:.1%}, miss_latency={self.miss_latency * 1e3:.1f}ms, "
+                f"stale_serves={self.stale_serves}, refreshes={self.refreshes}, "
+                f"refresh_errors={self.refresh_errors})")
+
+
+class TTLCache:
+    """
+    Cache por chave com expiração (TTL) e descarte LRU quando o número de
+    entradas (max_entries) ou o tamanho estimado (max_bytes) é ultrapassado.
+    O tamanho de cada valor é calculado pelo sizeof (raso por padrão).
+
+    Com stale_ttl, a entrada expirada continua disponível como "stale" por
+    mais stale_ttl segundos através do lookup (stale-while-revalidate).
+    """
+
+    def __init__(self, ttl: Optional[float] = 60,
+                 max_entries: Optional[int] = 1024,
+                 max_bytes: Optional[int] = None,
+                 sizeof: Callable[[Any], int] = sys.getsizeof,
+                 clock: Callable[[], float] = monotonic,
+                 stale_ttl: float = 0) -> None:
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, Tuple[Any, float, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = Lock()
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry[1] > self._clock()
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        value, fresh = self.lookup(key, stale=False)
+        return value if fresh else default
+
+    def lookup(self, key: Hashable, stale: bool = True) -> Tuple[Any, bool]:
+        """
+        Retorna (valor, fresh). Uma entrada expirada, mas dentro do stale_ttl,
+        retorna (valor, False) quando stale=True. Sem entrada, (_MISSING, False).
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] + self.stale_ttl <= now:
+                self._remove(key)
+                entry = None
+            if entry is None or (entry[1] <= now and not stale):
+                self.stats.misses += 1
+                return _MISSING, False
+            self._entries.move_to_end(key)
+            if entry[1] <= now:
+                self.stats.stale_serves += 1
+                return entry[0], False
+            self.stats.hits += 1
+            return entry[0], True
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self.set_many([(key, value)])
+
+    def set_many(self, items: Iterable[Tuple[Hashable, Any]]) -> None:
+        """
+        Armazena várias entradas travando o cache uma única vez.
+        """
+        self.set_many_ttl((key, value, None) for key, value in items)
+
+    def set_many_ttl(self, items: Iterable[Tuple[Hashable, Any, Optional[float]]]) -> None:
+        """
+        Como o set_many, mas com o TTL restante (s) de cada entrada, limitado
+        ao ttl do cache. Com None, a entrada usa o ttl do cache.
+        """
+        now = self._clock()
+        default = now + self.ttl if self.ttl is not None else float('inf')
+        entries, sizeof = self._entries, self._sizeof
+        with self._lock:
+            for key, value, ttl in items:
+                expires_at = default if ttl is None else min(default, now + ttl)
+                if key in entries:
+                    self._remove(key)
+                size = sizeof(value)
+                entries[key] = (value, expires_at, size)
+                self._bytes += size
+            while entries and (
+                    (self.max_entries is not None and len(entries) > self.max_entries)
+                    or (self.max_bytes is not None and self._bytes > self.max_bytes)):
+                self._remove(next(iter(entries)))
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Remove a chave do cache, ou todas as entradas se nenhuma for informada.
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self._bytes = 0
+            elif key in self._entries:
+                self._remove(key)
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Retorna o valor válido da chave sem alterar a ordem LRU ou os contadores.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[1] <= self._clock():
+            return default
+        return entry[0]
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Retorna o valor em cache ou o carrega pelo loader, armazenando o mesmo.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = self.load(key, loader)
+        return value
+
+    def load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Carrega o valor pelo loader e o armazena, a menos que outra chamada
+        já o tenha armazenado nesse meio tempo.
+        """
+        value = self.peek(key, _MISSING)
+        if value is _MISSING:
+            start = perf_counter()
+            value = loader()
+            self.stats.loads += 1
+            self.stats.load_time += perf_counter() - start
+            self.set(key, value)
+        return value
+
+    def _remove(self, key: Hashable) -> None:
+        _value, _expires_at, size = self._entries.pop(key)
+        self._bytes -= size
+
+
+class DiskCacheTier:
+    """
+    Segundo nível de cache persistido em sqlite, consultado pelo Proxy
+    quando o TTLCache não possui a chave. As entradas guardam a versão do
+    formato: ao alterar a version, as entradas antigas são ignoradas.
+
+    As chaves são gravadas em JSON e os valores com pickle, que preserva
+    tuplas, chaves int e demais tipos. O arquivo deve ser de confiança, o
+    pickle executa código ao carregar. Um arquivo de um FORMAT anterior é
+    descartado ao abrir.
+
+    A expiração usa o relógio de parede (time), válido entre reinícios.
+    """
+
+    FORMAT = 2
+
+    def __init__(self, path: str, version: int = 1,
+                 ttl: Optional[float] = None) -> None:
+        self.path = path
+        self.version = version
+        self.ttl = ttl
+        self._lock = Lock()
+        # Importados aqui, apenas o Proxy com disk tier utiliza o sqlite.
+        import pickle
+        import sqlite3
+        from functools import partial
+
+        self._dumps = partial(pickle.dumps, protocol=pickle.HIGHEST_PROTOCOL)
+        self._loads = pickle.loads
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        with self._db:
+            if self._db.execute('PRAGMA user_version').fetchone()[0] != self.FORMAT:
+                self._db.execute('DROP TABLE IF EXISTS cache')
+                self._db.execute(f'PRAGMA user_version = {self.FORMAT}')
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS cache ('
+                'key TEXT PRIMARY KEY, version INTEGER NOT NULL, '
+                'expires_at REAL, value BLOB NOT NULL)')
+
+    @staticmethod
+    def _encode_key(key: Hashable) -> str:
+        return json.dumps(key)
+
+    @staticmethod
+    def _decode_key(key: str) -> Hashable:
+        key = json.loads(key)
+        return tuple(key) if isinstance(key, list) else key
+
+    def _expires_at(self) -> Optional[float]:
+        return time() + self.ttl if self.ttl is not None else None
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            row = self._db.execute(
+                'SELECT value FROM cache WHERE key = ? AND version = ? '
+                'AND (expires_at IS NULL OR expires_at > ?)',
+                (self._encode_key(key), self.version, time())).fetchone()
+        return self._loads(row[0]) if row is not None else default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self.set_many([(key, value)])
+
+    def set_many(self, items: Iterable[Tuple[Hashable, Any]]) -> None:
+        """
+        Grava várias entradas em uma única transação.
+        """
+        expires_at, dumps = self._expires_at(), self._dumps
+        rows = ((self._encode_key(key), self.version, expires_at, dumps(value))
+                for key, value in items)
+        with self._lock, self._db:
+            self._db.executemany('INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)', rows)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        with self._lock, self._db:
+            if key is None:
+                self._db.execute('DELETE FROM cache')
+            else:
+                self._db.execute('DELETE FROM cache WHERE key = ?', (self._encode_key(key),))
+
+    def entries(self, batch_size: int = 50_000) -> Iterator[Tuple[Hashable, Any, Optional[float]]]:
+        """
+        Percorre as entradas válidas da versão atual como (chave, valor,
+        expires_at). As chaves de cada lote são decodificadas com um único
+        json.loads, em vez de uma chamada por entrada.
+        """
+        with self._lock:
+            rows = self._db.execute(
+                'SELECT key, value, expires_at FROM cache WHERE version = ? '
+                'AND (expires_at IS NULL OR expires_at > ?)',
+                (self.version, time())).fetchall()
+
+        loads = self._loads
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            keys = json.loads('[' + ','.join(row[0] for row in batch) + ']')
+            for key, (_key, value, expires_at) in zip(keys, batch):
+                yield tuple(key) if isinstance(key, list) else key, loads(value), expires_at
+
+    def close(self) -> None:
+        self._db.close()
+
+
+class HedgedSubject(ISubject):
+    """
+    Envia a chamada para uma réplica e, se a resposta passar do percentil
+    hedge_percentile das latências recentes, envia uma cópia para a próxima
+    réplica: a primeira resposta vence. Se a primeira réplica falhar, a cópia
+    é enviada sem esperar. Com deadline (no construtor ou por chamada), a
+    chamada levanta TimeoutError quando nenhuma réplica responde a tempo.
+
+    Para usá-lo com cache, passe-o ao Proxy pelo subject_factory.
+    """
+
+    def __init__(self, replicas: Sequence[ISubject],
+                 deadline: Optional[float] = None,
+                 hedge_percentile: float = 0.95,
+                 hedge_delay: float = 0.05,
+                 window: int = 1000,
+                 workers: int = 32) -> None:
+        self._replicas = list(replicas)
+        self._next = itertools.cycle(range(len(self._replicas)))
+        self.deadline = deadline
+        self.hedge_percentile = hedge_percentile
+        self.hedge_delay = hedge_delay
+        self._latencies: deque = deque(maxlen=window)
+        self._executor = ThreadPoolExecutor(workers)
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.deadline_exceeded = 0
+
+    @property
+    def hedge_after(self) -> float:
+        """
+        Tempo de espera antes da cópia: o percentil das latências recentes,
+        ou o hedge_delay enquanto houver poucas amostras.
+        """
+        latencies = sorted(self._latencies)
+        if len(latencies) < 20:
+            return self.hedge_delay
+        return latencies[min(int(len(latencies) * self.hedge_percentile), len(latencies) - 1)]
+
+    def get_all(self, deadline: Optional[float] = None) -> List[Dict]:
+        return self._call('get_all', (), deadline)
+
+    def get_user_data(self, id: int, deadline: Optional[float] = None) -> Dict:
+        return self._call('get_user_data', (id,), deadline)
+
+    def get_many(self, ids: Sequence[int], deadline: Optional[float] = None) -> List[Dict]:
+        return self._call('get_many', (ids,), deadline)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    def _timed(self, replica: ISubject, method: str, args: tuple) -> Any:
+        start = perf_counter()
+        result = getattr(replica, method)(*args)
+        self._latencies.append(perf_counter() - start)
+        return result
+
+    def _submit(self, replica: int, method: str, args: tuple) -> Future:
+        return self._executor.submit(self._timed, self._replicas[replica], method, args)
+
+    def _call(self, method: str, args: tuple, deadline: Optional[float] = None) -> Any:
+        """
+        O deadline da chamada substitui o do construtor. Se a primeira
+        tentativa falhar antes do hedge_after, a cópia é enviada na hora.
+        """
+        self.calls += 1
+        if deadline is None:
+            deadline = self.deadline
+        deadline_at = perf_counter() + deadline if deadline is not None else None
+
+        def remaining() -> Optional[float]:
+            return None if deadline_at is None else max(0.0, deadline_at - perf_counter())
+
+        # A cópia vai sempre para a réplica seguinte à da primeira tentativa,
+        # nunca para a mesma, mesmo com chamadas concorrentes.
+        replica = next(self._next)
+        first = self._submit(replica, method, args)
+        pending = {first}
+        hedged = len(self._replicas) < 2
+        timeout = remaining() if hedged else self.hedge_after
+        if deadline_at is not None:
+            timeout = min(timeout, remaining())
+
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.exception() is None:
+                        if future is not first:
+                            self.hedge_wins += 1
+                        return future.result()
+                    error = future.exception()
+                if not hedged and remaining() != 0.0:
+                    # Primeira tentativa lenta ou com erro: envia a cópia.
+                    hedged = True
+                    self.hedges += 1
+                    pending.add(self._submit((replica + 1) % len(self._replicas), method, args))
+                elif not done:
+                    self.deadline_exceeded += 1
+                    raise TimeoutError(f"HedgedSubject: {method} excedeu o deadline de {deadline}s.")
+                timeout = remaining()
+            raise error
+        finally:
+            # Libera o pool das tentativas perdedoras que ainda não iniciaram.
+            for future in pending:
+                future.cancel()
+
+
+class SingleFlight:
+    """
+    Agrupa chamadas concorrentes para a mesma chave: apenas a primeira
+    thread executa a função e as demais aguardam o mesmo resultado.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = Lock()
+        self.shared = 0
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+            else:
+                self.shared += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = function()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """
+    Versão asyncio do SingleFlight: as tasks concorrentes aguardam a
+    mesma corrotina em andamento. Se a task líder for cancelada, as demais
+    não recebem o cancelamento, a primeira delas assume a carga.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self.shared = 0
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable[Any]]) -> Any:
+        import asyncio
+
+        while True:
+            future = self._calls.get(key)
+            if future is None:
+                return await self._lead(key, function)
+
+            self.shared += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # Apenas o cancelamento da própria task é propagado.
+                if not future.cancelled():
+                    raise
+
+    async def _lead(self, key: Hashable, function: Callable[[], Awaitable[Any]]) -> Any:
+        import asyncio
+
+        future = self._calls[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await function()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Marca a exceção como recuperada caso nenhuma task esteja aguardando.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
 
 class Proxy(ISubject):
     """
@@ -73,27 +597,787 @@ class Proxy(ISubject):
       - proxy caches
     """
 
-    _subject: RealSubject = None
-    _all_users: List[Dict]
-    _user = {}
+    def __init__(self, cache: Optional[TTLCache] = None,
+                 single_flight: bool = True,
+                 disk: Optional[DiskCacheTier] = None,
+                 refresh_workers: int = 0,
+                 subject_factory: Callable[[], ISubject] = RealSubject) -> None:
+        """
+        O subject_factory cria o objeto real no primeiro uso, por exemplo um
+        HedgedSubject com as réplicas.
+
+        Com refresh_workers > 0 e um TTLCache com stale_ttl, a entrada
+        expirada é retornada na hora e atualizada em segundo plano por no
+        máximo refresh_workers threads (stale-while-revalidate).
+        """
+        self._subject: Optional[ISubject] = None
+        self._subject_factory = subject_factory
+        self.cache = cache if cache is not None else TTLCache()
+        self.flight = SingleFlight() if single_flight else None
+        self.disk = disk
+        self.refresher = ThreadPoolExecutor(refresh_workers) if refresh_workers else None
+        self._refreshing: Set[Hashable] = set()
+        self._refresh_lock = Lock()
+        # Versão de cada chave, alterada pelo invalidate, para descartar as
+        # atualizações em segundo plano iniciadas antes da invalidação.
+        self._epoch = 0
+        self._versions: Dict[Hashable, int] = {}
 
-    def instance(self):
+    def instance(self) -> ISubject:
         if self._subject is None:
-            self._subject = RealSubject()
+            self._subject = self._subject_factory()
 
         return self._subject
 
-    def get_all(self):
-        if not hasattr(self, '_all_users'):
-            self._all_users = self._subject.get_all()
+    def get_all(self) -> List[Dict]:
+        return self._get('all', lambda: self.instance().get_all())
+
+    def get_user_data(self, id: int) -> Dict:
+        return self._get(('user', id), lambda: self.instance().get_user_data(id))
+
+    def get_many(self, ids: Sequence[int]) -> List[Dict]:
+        """
+        Retorna os usuários do cache e busca os demais em uma única
+        chamada ao get_many do RealSubject.
+        """
+        found = {}
+        for id in ids:
+            value = self.cache.get(('user', id), _MISSING)
+            if value is not _MISSING:
+                found[id] = value
+
+        missing = [id for id in dict.fromkeys(ids) if id not in found]
+        if missing and self.disk is not None:
+            for id in missing:
+                value = self.disk.get(('user', id), _MISSING)
+                if value is not _MISSING:
+                    self.cache.set(('user', id), value)
+                    found[id] = value
+            missing = [id for id in missing if id not in found]
+
+        if missing:
+            start = perf_counter()
+            values = self.instance().get_many(missing)
+            self.cache.stats.loads += 1
+            self.cache.stats.load_time += perf_counter() - start
+            for id, value in zip(missing, values):
+                self.cache.set(('user', id), value)
+                found[id] = value
+            if self.disk is not None:
+                self.disk.set_many((('user', id), found[id]) for id in missing)
+
+        return [found[id] for id in ids]
+
+    def _get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Busca no cache e, em caso de erro, carrega pelo RealSubject. Com o
+        single flight, chamadas simultâneas da mesma chave fazem uma única carga.
+        """
+        if self.refresher is None:
+            value = self.cache.get(key, _MISSING)
+        else:
+            value, fresh = self.cache.lookup(key)
+            if value is not _MISSING and not fresh:
+                self._revalidate(key, loader)
+
+        if value is _MISSING:
+            if self.disk is not None:
+                loader = self._through_disk(key, loader)
+            if self.flight is None:
+                value = self.cache.load(key, loader)
+            else:
+                value = self.flight.do(key, lambda: self.cache.load(key, loader))
+        return value
+
+    def _revalidate(self, key: Hashable, loader: Callable[[], Any]) -> None:
+        """
+        Agenda a atualização da chave, no máximo uma por chave ao mesmo tempo.
+        """
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            version = self._version(key)
+        self.refresher.submit(self._refresh, key, loader, version)
+
+    def _version(self, key: Hashable) -> Tuple[int, int]:
+        return self._epoch, self._versions.get(key, 0)
+
+    def _refresh(self, key: Hashable, loader: Callable[[], Any],
+                 version: Tuple[int, int]) -> None:
+        try:
+            value = loader()
+            with self._refresh_lock:
+                # Invalidada durante a carga: o valor pode estar desatualizado.
+                if self._version(key) != version:
+                    return
+                self.cache.set(key, value)
+                if self.disk is not None:
+                    self.disk.set(key, value)
+            self.cache.stats.refreshes += 1
+        except Exception:
+            # O valor stale continua em cache até o fim do stale_ttl.
+            self.cache.stats.refresh_errors += 1
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(key)
+
+    def _through_disk(self, key: Hashable,
+                      loader: Callable[[], Any]) -> Callable[[], Any]:
+        """
+        Envolve o loader para consultar o DiskCacheTier antes do RealSubject
+        e persistir os valores carregados.
+        """
+        def load() -> Any:
+            value = self.disk.get(key, _MISSING)
+            if value is _MISSING:
+                value = loader()
+                self.disk.set(key, value)
+            return value
+        return load
+
+    def warm(self) -> int:
+        """
+        Carrega no TTLCache as entradas persistidas no DiskCacheTier,
+        usado após um reinício. Cada entrada mantém o tempo restante até o
+        expires_at do disco, limitado ao ttl do cache. Retorna o total carregado.
+        """
+        if self.disk is None:
+            return 0
+        before = len(self.cache)
+        now = time()
+        self.cache.set_many_ttl(
+            (key, value, None if expires_at is None else expires_at - now)
+            for key, value, expires_at in self.disk.entries())
+        return len(self.cache) - before
+
+    def invalidate(self, id: Optional[int] = None) -> None:
+        """
+        Remove o usuário do cache, ou todo o cache se nenhum id for informado.
+        """
+        key = None if id is None else ('user', id)
+        with self._refresh_lock:
+            if key is None:
+                self._epoch += 1
+                self._versions.clear()
+            else:
+                self._versions[key] = self._versions.get(key, 0) + 1
+            self.cache.invalidate(key)
+            if self.disk is not None:
+                self.disk.invalidate(key)
+
+
+class AccessPredictor:
+    """
+    Aprende padrões simples de acesso: sequencial (i, i+1, ...) e os
+    seguidores mais recentes de cada id, prevendo os próximos ids.
+    """
+
+    def __init__(self, depth: int = 4, followers: int = 4,
+                 max_tracked: int = 10_000) -> None:
+        self.depth = depth
+        self.followers = followers
+        self.max_tracked = max_tracked
+        self._followers: OrderedDict[int, deque] = OrderedDict()
+        self._last: Optional[int] = None
+        self._run = 0
+
+    def record(self, id: int) -> List[int]:
+        """
+        Registra o acesso e retorna os ids previstos para os próximos acessos.
+        """
+        last, self._last = self._last, id
+        if last is not None:
+            followers = self._followers.get(last)
+            if followers is None:
+                followers = self._followers[last] = deque(maxlen=self.followers)
+                if len(self._followers) > self.max_tracked:
+                    self._followers.popitem(last=False)
+            if id in followers:
+                followers.remove(id)
+            followers.appendleft(id)
+            self._run = self._run + 1 if id == last + 1 else 0
+
+        if self._run:
+            return [id + offset for offset in range(1, self.depth + 1)]
+        return list(self._followers.get(id, ()))[:self.depth]
+
+
+class PrefetchingProxy(Proxy):
+    """
+    Proxy virtual: o RealSubject só é criado no primeiro uso. A cada acesso, o AccessPredictor prevê os próximos ids, que
+    são buscados em segundo plano com um único get_many, respeitando o
+    budget de ids por acesso e o número de workers.
+
+    Os ids buscados e ainda não lidos são guardados até max_prefetched
+    (por padrão o max_entries do cache), descartando os mais antigos.
+    """
+
+    def __init__(self, subject_factory: Callable[[], ISubject] = RealSubject,
+                 cache: Optional[TTLCache] = None,
+                 predictor: Optional[AccessPredictor] = None,
+                 budget: int = 4, workers: int = 2,
+                 max_prefetched: Optional[int] = None) -> None:
+        super().__init__(cache, subject_factory=subject_factory)
+        self.predictor = predictor if predictor is not None else AccessPredictor(depth=budget)
+        self.budget = budget
+        self.max_prefetched = max_prefetched or self.cache.max_entries or 1024
+        self._executor = ThreadPoolExecutor(workers)
+        self._inflight: Dict[int, Future] = {}
+        self._prefetched: OrderedDict[int, None] = OrderedDict()
+        self._lock = Lock()
+        self.prefetched = 0
+        self.prefetch_hits = 0
+        self.prefetch_errors = 0
+
+    @property
+    def prefetch_hit_rate(self) -> float:
+        """Fração dos ids buscados antecipadamente que foram de fato usados."""
+        return self.prefetch_hits / self.prefetched if self.prefetched else 0.0
+
+    def instance(self) -> ISubject:
+        if self._subject is None:
+            with self._lock:
+                if self._subject is None:
+                    self._subject = self._subject_factory()
+        return self._subject
+
+    def get_user_data(self, id: int) -> Dict:
+        # Cria o subject antes do prefetch, que o usa em segundo plano.
+        self.instance()
+        with self._lock:
+            future = self._inflight.get(id)
+            self._claim(id)
+
+        if future is not None:
+            # Aguarda o prefetch em andamento em vez de repetir a chamada.
+            future.exception()
+            with self._lock:
+                self._claim(id)
+
+        value = super().get_user_data(id)
+        self._prefetch(self.predictor.record(id))
+        return value
+
+    def get_many(self, ids: Sequence[int]) -> List[Dict]:
+        with self._lock:
+            for id in ids:
+                self._claim(id)
+        return super().get_many(ids)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    def _claim(self, id: int) -> None:
+        """
+        Conta o acesso como prefetch hit se o id foi buscado antecipadamente
+        e o valor ainda está no cache (não expirou nem foi descartado).
+        """
+        if self._prefetched.pop(id, _MISSING) is not _MISSING and ('user', id) in self.cache:
+            self.prefetch_hits += 1
+
+    def _prefetch(self, ids: List[int]) -> None:
+        with self._lock:
+            ids = [id for id in dict.fromkeys(ids)
+                   if id not in self._inflight and ('user', id) not in self.cache][:self.budget]
+            if not ids:
+                return
+            future = self._executor.submit(self._load, ids)
+            for id in ids:
+                self._inflight[id] = future
+
+    def _load(self, ids: List[int]) -> None:
+        try:
+            values = self._subject.get_many(ids)
+        except Exception:
+            self.prefetch_errors += 1
+            raise
+        else:
+            self.cache.set_many((('user', id), value) for id, value in zip(ids, values))
+            with self._lock:
+                prefetched = self._prefetched
+                for id in ids:
+                    prefetched[id] = None
+                    prefetched.move_to_end(id)
+                while len(prefetched) > self.max_prefetched:
+                    prefetched.popitem(last=False)
+                self.prefetched += len(ids)
+        finally:
+            with self._lock:
+                for id in ids:
+                    self._inflight.pop(id, None)
+
+
+class BatchingProxy(ISubject):
+    """
+    Proxy no estilo DataLoader: os get_user_data feitos por threads diferentes
+    dentro da mesma janela (window, em segundos) são agrupados em um único
+    get_many no RealSubject, e cada thread recebe apenas o seu resultado.
+    O lote é enviado antes do fim da janela ao atingir max_batch ids.
+    """
+
+    def __init__(self, subject: ISubject, window: float = 0.005,
+                 max_batch: int = 100) -> None:
+        self._subject = subject
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: Dict[int, Future] = {}
+        self._timer: Optional[Timer] = None
+        self._lock = Lock()
+        self.batches = 0
+
+    def get_all(self) -> List[Dict]:
+        return self._subject.get_all()
+
+    def get_many(self, ids: Sequence[int]) -> List[Dict]:
+        return self._subject.get_many(ids)
+
+    def get_user_data(self, id: int) -> Dict:
+        batch = None
+        with self._lock:
+            future = self._pending.get(id)
+            if future is None:
+                future = self._pending[id] = Future()
+                if len(self._pending) >= self.max_batch:
+                    batch = self._take()
+                elif self._timer is None:
+                    self._timer = Timer(self.window, self._flush)
+                    self._timer.args = (self._timer,)
+                    self._timer.daemon = True
+                    self._timer.start()
+
+        if batch:
+            self._dispatch(batch)
+        return future.result()
+
+    def _take(self) -> Dict[int, Future]:
+        batch, self._pending = self._pending, {}
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return batch
+
+    def _flush(self, timer: Timer) -> None:
+        with self._lock:
+            # O lote desta janela já pode ter sido enviado pelo max_batch.
+            if self._timer is not timer:
+                return
+            batch = self._take()
+        self._dispatch(batch)
+
+    def _dispatch(self, batch: Dict[int, Future]) -> None:
+        self.batches += 1
+        ids = list(batch)
+        try:
+            values = self._subject.get_many(ids)
+        except BaseException as exc:
+            for future in batch.values():
+                future.set_exception(exc)
+        else:
+            for id, value in zip(ids, values):
+                batch[id].set_result(value)
+
+
+class AsyncBatchingProxy:
+    """
+    Versão asyncio do BatchingProxy: agrupa os get_user_data feitos no mesmo
+    tick do event loop em um único get_many.
+    """
+
+    def __init__(self, subject: ISubject) -> None:
+        self._subject = subject
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self.batches = 0
+
+    async def get_user_data(self, id: int) -> Dict:
+        import asyncio
+
+        future = self._pending.get(id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if not self._pending:
+                loop.call_soon(self._flush)
+            future = self._pending[id] = loop.create_future()
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        import asyncio
+
+        batch, self._pending = self._pending, {}
+        task = asyncio.ensure_future(self._dispatch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: Dict[int, asyncio.Future]) -> None:
+        import asyncio
+
+        self.batches += 1
+        ids = list(batch)
+        try:
+            values = await asyncio.to_thread(self._subject.get_many, ids)
+        except Exception as exc:
+            for future in batch.values():
+                future.set_exception(exc)
+        else:
+            for id, value in zip(ids, values):
+                batch[id].set_result(value)
+
+
+Address = Union[Tuple[str, int], str]
+"""
+Endereço TCP (host, porta) ou caminho de um Unix socket.
+"""
+
+_FRAME = struct.Struct('!I')
+
+
+def _write_frame(sock: socket.socket, message: Dict) -> None:
+    payload = json.dumps(message).encode()
+    sock.sendall(_FRAME.pack(len(payload)) + payload)
+
+
+def _read_frame(stream: BinaryIO) -> Optional[Dict]:
+    header = stream.read(_FRAME.size)
+    if len(header) < _FRAME.size:
+        return None
+    (length,) = _FRAME.unpack(header)
+    return json.loads(stream.read(length))
+
+
+class RemoteSubjectError(Exception):
+    """Erro levantado pelo RealSubject no servidor."""
+
+
+class _SubjectRequestHandler:
+    """
+    Lê as requisições da conexão sem esperar as respostas anteriores
+    (pipelining). Cada uma é executada no pool do servidor e respondida
+    assim que termina, identificada pelo id.
+
+    Segue o protocolo do socketserver.BaseRequestHandler (setup, handle e
+    finish no construtor) sem herdar dele, o socketserver só é importado
+    quando um SubjectServer é criado.
+    """
+
+    def __init__(self, request: socket.socket, client_address: Any, server: Any) -> None:
+        self.request = request
+        self.client_address = client_address
+        self.server = server
+        self.setup()
+        try:
+            self.handle()
+        finally:
+            self.finish()
+
+    def setup(self) -> None:
+        self.rfile = self.request.makefile('rb')
+        with self.server.connections_lock:
+            self.server.connections.add(self.request)
+
+    def finish(self) -> None:
+        with self.server.connections_lock:
+            self.server.connections.discard(self.request)
+        self.rfile.close()
+
+    def handle(self) -> None:
+        write_lock = Lock()
+        while True:
+            try:
+                request = _read_frame(self.rfile)
+            except (OSError, ValueError):
+                break
+            if request is None:
+                break
+            try:
+                self.server.executor.submit(self._reply, request, write_lock)
+            except RuntimeError:
+                # O servidor foi encerrado enquanto a requisição era lida.
+                break
+
+    def _reply(self, request: Dict, write_lock: Lock) -> None:
+        response = {'id': request['id']}
+        try:
+            if request['method'] not in SubjectServer.METHODS:
+                raise AttributeError(f"método não permitido: {request['method']}")
+            method = getattr(self.server.subject, request['method'])
+            response['result'] = method(*request['args'])
+        except Exception as exc:
+            response['error'] = f"{type(exc).__name__}: {exc}"
+        with write_lock:
+            try:
+                _write_frame(self.request, response)
+            except OSError:
+                pass
+
+
+_server_types: Dict[bool, type] = {}
+
+
+def _server_type(unix: bool) -> type:
+    """
+    Retorna a subclasse local do servidor TCP ou Unix com daemon_threads,
+    criada no primeiro uso para não importar o socketserver com o módulo.
+    """
+    server_type = _server_types.get(unix)
+    if server_type is None:
+        import socketserver
+
+        base = socketserver.ThreadingUnixStreamServer if unix else socketserver.ThreadingTCPServer
+        server_type = _server_types[unix] = type(
+            '_UnixSubjectServer' if unix else '_TCPSubjectServer',
+            (base,), {'daemon_threads': True, '__module__': __name__})
+    return server_type
+
+
+class SubjectServer:
+    """
+    Servidor local que expõe um ISubject por TCP (localhost) ou Unix socket,
+    usado como substituto do serviço real.
+    """
+
+    METHODS = frozenset({'get_all', 'get_user_data', 'get_many'})
+
+    def __init__(self, subject: ISubject, address: Address = ('127.0.0.1', 0),
+                 workers: int = 64) -> None:
+        self._server = _server_type(isinstance(address, str))(address, _SubjectRequestHandler)
+        self._server.subject = subject
+        self._server.executor = ThreadPoolExecutor(workers)
+        self._server.connections = set()
+        self._server.connections_lock = Lock()
+        self._path = address if isinstance(address, str) else None
+        self._thread: Optional[Thread] = None
+
+    @property
+    def address(self) -> Address:
+        return self._server.server_address
+
+    def start(self) -> SubjectServer:
+        self._thread = Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """
+        Encerra o servidor e as conexões abertas, e remove o arquivo do
+        Unix socket para que o mesmo caminho possa ser usado de novo.
+        """
+        import socket
+
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread = None
+        self._server.server_close()
+        with self._server.connections_lock:
+            connections = list(self._server.connections)
+        for connection in connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self._server.executor.shutdown(wait=False)
+        if self._path is not None:
+            try:
+                os.unlink(self._path)
+            except FileNotFoundError:
+                pass
+
+    def __enter__(self) -> SubjectServer:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class _Connection:
+    """
+    Conexão persistente com o SubjectServer. Várias requisições podem estar
+    em andamento ao mesmo tempo, uma thread leitora entrega cada resposta
+    ao Future correspondente. Depois de encerrada, a conexão não é reaberta,
+    o RemoteSubject a substitui por uma nova.
+    """
+
+    def __init__(self, address: Address) -> None:
+        import socket
+
+        if isinstance(address, str):
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._sock.connect(address)
+        else:
+            self._sock = socket.create_connection(address)
+            self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._stream = self._sock.makefile('rb')
+        self._send_lock = Lock()
+        # Protege o _pending e o _closed: uma requisição é registrada apenas
+        # se a thread leitora ainda não encerrou a conexão.
+        self._lock = Lock()
+        self._pending: Dict[int, Future] = {}
+        self._ids = itertools.count()
+        self._closed = False
+        Thread(target=self._read_responses, daemon=True).start()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def call(self, method: str, args: Sequence) -> Future:
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise ConnectionError("Conexão com o SubjectServer encerrada.")
+            request_id = next(self._ids)
+            self._pending[request_id] = future
+        try:
+            with self._send_lock:
+                _write_frame(self._sock, {'id': request_id, 'method': method, 'args': list(args)})
+        except OSError as exc:
+            self._fail(ConnectionError(f"Conexão com o SubjectServer encerrada: {exc}"))
+        return future
+
+    def _read_responses(self) -> None:
+        try:
+            while True:
+                response = _read_frame(self._stream)
+                if response is None:
+                    break
+                with self._lock:
+                    future = self._pending.pop(response['id'])
+                if 'error' in response:
+                    future.set_exception(RemoteSubjectError(response['error']))
+                else:
+                    future.set_result(response['result'])
+        except (OSError, ValueError):
+            pass
+        finally:
+            self._fail(ConnectionError("Conexão com o SubjectServer encerrada."))
+
+    def _fail(self, error: ConnectionError) -> None:
+        """
+        Marca a conexão como encerrada e falha as requisições pendentes.
+        """
+        with self._lock:
+            self._closed = True
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    def close(self) -> None:
+        import socket
+
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._stream.close()
+        self._sock.close()
+
+
+class RemoteSubject(ISubject):
+    """
+    Proxy remoto: implementa o ISubject enviando as chamadas para um
+    SubjectServer, distribuídas entre um pool de conexões persistentes.
+    Uma conexão encerrada é reaberta no próximo uso, as requisições que
+    estavam nela falham com ConnectionError.
+    """
+
+    def __init__(self, address: Address, connections: int = 4,
+                 timeout: Optional[float] = None) -> None:
+        self.address = address
+        self.timeout = timeout
+        self._pool = [_Connection(address) for _ in range(connections)]
+        self._next = itertools.cycle(range(connections))
+        self._pool_lock = Lock()
+        self._closed = False
+        self.reconnects = 0
+
+    def call(self, method: str, *args: Any) -> Future:
+        """
+        Envia a requisição sem aguardar a resposta (pipelining).
+        """
+        slot = next(self._next)
+        connection = self._pool[slot]
+        if not connection.closed:
+            try:
+                return connection.call(method, args)
+            except ConnectionError:
+                pass
+        return self._reconnect(slot, connection).call(method, args)
+
+    def _reconnect(self, slot: int, connection: _Connection) -> _Connection:
+        """
+        Substitui a conexão encerrada do slot, apenas uma thread reconecta.
+        """
+        with self._pool_lock:
+            if self._closed:
+                raise ConnectionError("RemoteSubject encerrado.")
+            if self._pool[slot] is connection:
+                connection.close()
+                self._pool[slot] = _Connection(self.address)
+                self.reconnects += 1
+            return self._pool[slot]
+
+    def get_all(self) -> List[Dict]:
+        return self.call('get_all').result(self.timeout)
+
+    def get_user_data(self, id: int) -> Dict:
+        return self.call('get_user_data', id).result(self.timeout)
+
+    def get_many(self, ids: Sequence[int]) -> List[Dict]:
+        return self.call('get_many', list(ids)).result(self.timeout)
+
+    def close(self) -> None:
+        with self._pool_lock:
+            self._closed = True
+        for connection in self._pool:
+            connection.close()
 
-        return self._all_users
+    def __enter__(self) -> RemoteSubject:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class AsyncProxy:
+    """
+    Variante asyncio do Proxy: as chamadas ao RealSubject são executadas
+    em uma thread (asyncio.to_thread) e, com o single flight, tasks
+    simultâneas da mesma chave aguardam uma única chamada.
+    """
 
-    def get_user_data(self, id: int):
-        if self._user != self._all_users[id]:
-            self._user = self._subject.get_user_data(id)
+    def __init__(self, subject: ISubject, cache: Optional[TTLCache] = None,
+                 single_flight: bool = True) -> None:
+        self._subject = subject
+        self.cache = cache if cache is not None else TTLCache()
+        self.flight = AsyncSingleFlight() if single_flight else None
 
-        return self._user
+    async def get_all(self) -> List[Dict]:
+        return await self._get('all', self._subject.get_all)
+
+    async def get_user_data(self, id: int) -> Dict:
+        return await self._get(('user', id), lambda: self._subject.get_user_data(id))
+
+    async def _get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        value = self.cache.get(key, _MISSING)
+        if value is _MISSING:
+            if self.flight is None:
+                value = await self._load(key, loader)
+            else:
+                value = await self.flight.do(key, lambda: self._load(key, loader))
+        return value
+
+    async def _load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        import asyncio
+
+        value = self.cache.peek(key, _MISSING)
+        if value is _MISSING:
+            start = perf_counter()
+            value = await asyncio.to_thread(loader)
+            self.cache.stats.loads += 1
+            self.cache.stats.load_time += perf_counter() - start
+            self.cache.set(key, value)
+        return value
 
 
 def client_code(subject: Proxy) -> None:
@@ -117,7 +1401,285 @@ def client_code(subject: Proxy) -> None:
     print(f'RealSubject: {subject.get_user_data(2)}')
 
 
+def benchmark(requests: int = 200, latency: float = 0.01) -> None:
+    """
+    Ids alternados: compara o cache de um único usuário usado anteriormente
+    com o TTLCache por chave, contando as chamadas ao RealSubject.
+    """
+
+    class SingleSlotProxy(Proxy):
+        def __init__(self, subject_factory: Callable[[], ISubject]) -> None:
+            super().__init__(subject_factory=subject_factory)
+            self._user = None
+
+        def get_user_data(self, id: int) -> Dict:
+            if self._user != self.get_all()[id]:
+                self._user = self.instance().get_user_data(id)
+            return self._user
+
+    subject = lambda: RealSubject(latency)
+    print(f"requisições: {requests} | latência do RealSubject: {latency * 1e3:.0f} ms")
+    for proxy in (SingleSlotProxy(subject), Proxy(subject_factory=subject)):
+        start = perf_counter()
+        for i in range(requests):
+            proxy.get_user_data(i % 2)
+        elapsed = perf_counter() - start
+        print(f"{type(proxy).__name__:<16} {elapsed / requests * 1e3:>6.2f} ms/req | "
+              f"{proxy.instance().calls:>4} chamadas ao RealSubject")
+    print(proxy.cache.stats)
+
+
+def benchmark_single_flight(callers: int = 1000, latency: float = 0.05) -> None:
+    """
+    N threads e N tasks pedindo o mesmo usuário com o cache vazio,
+    com e sem o single flight.
+    """
+    import asyncio
+
+    print(f"chamadores: {callers} | latência do RealSubject: {latency * 1e3:.0f} ms")
+    for single_flight in (False, True):
+        proxy = Proxy(single_flight=single_flight,
+                      subject_factory=lambda: RealSubject(latency))
+        barrier = Barrier(callers)
+
+        def caller() -> None:
+            barrier.wait()
+            proxy.get_user_data(1)
+
+        threads = [Thread(target=caller) for _ in range(callers)]
+        start = perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = perf_counter() - start
+        print(f"threads | single flight: {str(single_flight):<5} | "
+              f"{elapsed * 1e3:>7.0f} ms | {proxy.instance().calls:>4} chamadas ao RealSubject")
+
+    async def run_tasks(single_flight: bool) -> None:
+        proxy = AsyncProxy(RealSubject(latency), single_flight=single_flight)
+        start = perf_counter()
+        await asyncio.gather(*(proxy.get_user_data(1) for _ in range(callers)))
+        elapsed = perf_counter() - start
+        print(f"asyncio | single flight: {str(single_flight):<5} | "
+              f"{elapsed * 1e3:>7.0f} ms | {proxy._subject.calls:>4} chamadas ao RealSubject")
+
+    for single_flight in (False, True):
+        asyncio.run(run_tasks(single_flight))
+
+
+def benchmark_batching(users: int = 50, latency: float = 0.1) -> None:
+    """
+    Uma página que precisa de N usuários, pedidos por N threads/tasks ao
+    mesmo tempo: compara chamadas individuais com o agrupamento em get_many.
+    """
+    import asyncio
+
+    data = [{'name': f'user {i + 1}', 'age': 20 + i} for i in range(users)]
+
+    def subject() -> RealSubject:
+        real_subject = RealSubject(latency)
+        real_subject._data = data
+        return real_subject
+
+    def run_threads(proxy: ISubject) -> float:
+        threads = [Thread(target=proxy.get_user_data, args=(id,)) for id in range(users)]
+        start = perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return perf_counter() - start
+
+    print(f"usuários: {users} | latência do RealSubject: {latency * 1e3:.0f} ms")
+
+    sequential = subject()
+    start = perf_counter()
+    for id in range(users):
+        sequential.get_user_data(id)
+    elapsed = perf_counter() - start
+    print(f"{'sequencial':<20} {elapsed * 1e3:>7.0f} ms | {sequential.calls:>3} chamadas")
+
+    for label, proxy_type in (('threads individuais', lambda s: s),
+                              ('BatchingProxy', BatchingProxy)):
+        real_subject = subject()
+        elapsed = run_threads(proxy_type(real_subject))
+        print(f"{label:<20} {elapsed * 1e3:>7.0f} ms | {real_subject.calls:>3} chamadas")
+
+    async def run_tasks() -> None:
+        real_subject = subject()
+        proxy = AsyncBatchingProxy(real_subject)
+        start = perf_counter()
+        await asyncio.gather(*(proxy.get_user_data(id) for id in range(users)))
+        elapsed = perf_counter() - start
+        print(f"{'AsyncBatchingProxy':<20} {elapsed * 1e3:>7.0f} ms | {real_subject.calls:>3} chamadas")
+
+    asyncio.run(run_tasks())
+
+
+def benchmark_remote(requests: int = 5_000, latency: float = 0.005,
+                     connections: Sequence[int] = (1, 2, 4, 8)) -> None:
+    """
+    Vazão do RemoteSubject contra um SubjectServer local, variando o
+    número de conexões do pool, com 64 threads e com o envio em pipeline.
+    """
+    print(f"requisições: {requests} | latência do RealSubject: {latency * 1e3:.0f} ms")
+    with SubjectServer(RealSubject(latency), workers=128) as server:
+        for count in connections:
+            with RemoteSubject(server.address, connections=count) as remote:
+                with ThreadPoolExecutor(64) as executor:
+                    start = perf_counter()
+                    list(executor.map(lambda i: remote.get_user_data(i % 3), range(requests)))
+                    threaded = perf_counter() - start
+
+                start = perf_counter()
+                futures = [remote.call('get_user_data', i % 3) for i in range(requests)]
+                for future in futures:
+                    future.result()
+                pipelined = perf_counter() - start
+
+            print(f"conexões: {count:>2} | 64 threads: {requests / threaded:>7.0f} req/s | "
+                  f"pipeline: {requests / pipelined:>7.0f} req/s")
+
+
+def benchmark_disk(users: int = 1_000_000) -> None:
+    """
+    Tempo para aquecer o cache após um reinício com N usuários persistidos
+    no DiskCacheTier, comparado ao custo de buscá-los no RealSubject.
+    """
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'proxy-cache.sqlite3')
+
+        disk = DiskCacheTier(path)
+        start = perf_counter()
+        disk.set_many((('user', id), {'name': f'user {id + 1}', 'age': 20 + id % 60})
+                      for id in range(users))
+        write_time = perf_counter() - start
+        disk.close()
+
+        # Reinício: nova instância do Proxy e do DiskCacheTier.
+        start = perf_counter()
+        proxy = Proxy(TTLCache(ttl=None, max_entries=None), disk=DiskCacheTier(path))
+        warmed = proxy.warm()
+        warm_time = perf_counter() - start
+        proxy.disk.close()
+
+    print(f"usuários: {users}")
+    print(f"gravação no disco:        {write_time:>8.2f} s")
+    print(f"warm start ({warmed} entradas): {warm_time:>8.2f} s")
+    print(f"RealSubject (2 s por usuário): {users * 2 / 3600:>8.0f} h")
+
+
+def benchmark_stale(duration: float = 2, latency: float = 0.2,
+                    ttl: float = 0.1) -> None:
+    """
+    Requisições contínuas com um TTL curto: compara a latência percebida
+    pelo chamador com e sem o stale-while-revalidate.
+    """
+    print(f"duração: {duration:.0f} s | TTL: {ttl * 1e3:.0f} ms | "
+          f"latência do RealSubject: {latency * 1e3:.0f} ms")
+    for refresh_workers in (0, 2):
+        proxy = Proxy(TTLCache(ttl=ttl, stale_ttl=60), refresh_workers=refresh_workers,
+                      subject_factory=lambda: RealSubject(latency))
+        for id in range(3):
+            proxy.get_user_data(id)
+
+        latencies = []
+        end = perf_counter() + duration
+        i = 0
+        while perf_counter() < end:
+            start = perf_counter()
+            proxy.get_user_data(i % 3)
+            latencies.append(perf_counter() - start)
+            i += 1
+            sleep(0.005)
+        if proxy.refresher is not None:
+            proxy.refresher.shutdown()
+
+        latencies.sort()
+        p99 = latencies[int(len(latencies) * 0.99)] * 1e3
+        print(f"refresh_workers={refresh_workers} | p99: {p99:>6.1f} ms | "
+              f"max: {latencies[-1] * 1e3:>6.1f} ms | {proxy.cache.stats}")
+
+
+def benchmark_hedged(requests: int = 500, deadline: float = 0.08) -> None:
+    """
+    Latência de cauda com réplicas HeavyTailSubject: uma réplica sem hedge,
+    duas réplicas com hedge no p95 e o mesmo com deadline.
+    """
+    def percentiles(latencies: List[float]) -> str:
+        latencies = sorted(latencies)
+        p = lambda q: latencies[min(int(len(latencies) * q), len(latencies) - 1)] * 1e3
+        return (f"p50: {p(0.5):>6.1f} ms | p99: {p(0.99):>6.1f} ms | "
+                f"max: {latencies[-1] * 1e3:>6.1f} ms")
+
+    print(f"requisições: {requests}")
+    for label, replicas, call_deadline in (
+            ('1 réplica', 1, None),
+            ('2 réplicas + hedge', 2, None),
+            (f'hedge + deadline {deadline * 1e3:.0f}ms', 2, deadline)):
+        subject = HedgedSubject([HeavyTailSubject(seed=seed) for seed in range(replicas)])
+        latencies = []
+        for i in range(requests):
+            start = perf_counter()
+            try:
+                subject.get_user_data(i % 3, deadline=call_deadline)
+            except TimeoutError:
+                pass
+            latencies.append(perf_counter() - start)
+        subject.close()
+        print(f"{label:<24} {percentiles(latencies)} | hedges: {subject.hedges:>3} "
+              f"(vitórias: {subject.hedge_wins:>3}) | timeouts: {subject.deadline_exceeded}")
+
+
+def benchmark_prefetch(users: int = 1_000, reads: int = 300,
+                       latency: float = 0.02, think_time: float = 0.005) -> None:
+    """
+    Leituras majoritariamente sequenciais com alguns saltos aleatórios:
+    compara o Proxy sob demanda com o PrefetchingProxy.
+    """
+    data = [{'name': f'user {i + 1}', 'age': 20 + i % 60} for i in range(users)]
+
+    def subject() -> RealSubject:
+        real_subject = RealSubject(latency)
+        real_subject._data = data
+        return real_subject
+
+    rng = random.Random(7)
+    ids, current = [], 0
+    for _ in range(reads):
+        current = rng.randrange(users - 20) if rng.random() < 0.05 else current + 1
+        ids.append(current)
+
+    print(f"leituras: {reads} | latência do RealSubject: {latency * 1e3:.0f} ms")
+    for proxy in (Proxy(subject_factory=subject), PrefetchingProxy(subject)):
+        start = perf_counter()
+        for id in ids:
+            proxy.get_user_data(id)
+            sleep(think_time)
+        elapsed = perf_counter() - start
+        line = (f"{type(proxy).__name__:<17} {elapsed / reads * 1e3:>6.2f} ms/leitura | "
+                f"{proxy.instance().calls:>3} chamadas | hit rate do cache: {proxy.cache.stats.hit_rate:.1%}")
+        if isinstance(proxy, PrefetchingProxy):
+            line += (f" | prefetch: {proxy.prefetched} ids, "
+                     f"hit rate {proxy.prefetch_hit_rate:.1%}")
+            proxy.close()
+        print(line)
+
+
 if __name__ == "__main__":
     print("Client: iniciando chamada dos objetos...")
     proxy = Proxy()
     client_code(proxy)
+
+    if "--bench" in sys.argv:
+        benchmark()
+        benchmark_single_flight()
+        benchmark_batching()
+        benchmark_remote()
+        benchmark_disk()
+        benchmark_stale()
+        benchmark_hedged()
+        benchmark_prefetch()
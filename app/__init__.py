@@ -0,0 +1,20 @@
+"""
+Aplicação dos padrões de projeto desenvolvidos pela GOF (Gangs Of Four).
+
+Os pacotes Criacional, Estrutural e Comportamental são carregados sob
+demanda, ex: `app.Estrutural.Proxy` importa apenas o módulo proxy.
+"""
+
+
+from ._lazy import attach
+
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    modules=(
+        'Comportamental',
+        'Criacional',
+        'Estrutural',
+    ),
+    exports={},
+)
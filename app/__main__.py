@@ -0,0 +1,71 @@
+"""
+Lista os padrões disponíveis em cada pacote. Com --bench, compara o tempo
+de importação a frio (-X importtime) do carregamento sob demanda com a
+importação de todos os módulos.
+"""
+
+
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+import app
+
+
+def _top_level_imports(code: str) -> Dict[str, int]:
+    """
+    Executa o código em um interpretador novo com -X importtime e retorna
+    o tempo cumulativo (us) de cada importação de nível superior.
+    """
+    root = Path(__file__).resolve().parent.parent
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=root, capture_output=True, text=True, check=True)
+    imports: Dict[str, int] = {}
+    for line in process.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        # Importações aninhadas têm o nome recuado e já estão no tempo
+        # cumulativo da importação que as causou.
+        fields = line.split('|')
+        if (len(fields) == 3 and fields[1].strip().isdigit()
+                and not fields[2][1:].startswith(' ')):
+            imports[fields[2].strip()] = int(fields[1])
+    return imports
+
+
+def import_time(code: str, runs: int = 5) -> float:
+    """
+    Retorna o menor tempo total de importação (ms) causado pelo código,
+    os módulos do pacote app e os da biblioteca padrão importados por eles.
+    As importações feitas na inicialização do interpretador são ignoradas.
+    O import_module do carregamento sob demanda não aninha as importações
+    no -X importtime, então são somadas todas as de nível superior.
+    """
+    startup = _top_level_imports('pass')
+    totals: List[float] = []
+    for _ in range(runs):
+        imports = _top_level_imports(code)
+        totals.append(sum(cumulative for name, cumulative in imports.items()
+                          if name not in startup) / 1e3)
+    return min(totals)
+
+
+def benchmark() -> None:
+    modules = [f'app.{package}.{module}'
+               for package in app.__all__
+               for module in getattr(app, package).__all__
+               if module.islower()]
+    eager = '; '.join(f'import {module}' for module in modules)
+    lazy = 'from app.Estrutural import Proxy'
+
+    print(f"todos os módulos ({len(modules)}): {import_time(eager):>7.1f} ms")
+    print(f"sob demanda (Proxy):     {import_time(lazy):>7.1f} ms")
+
+
+if __name__ == "__main__":
+    for package in app.__all__:
+        print(f"{package}: {', '.join(getattr(app, package).__all__)}")
+
+    if "--bench" in sys.argv:
+        benchmark()
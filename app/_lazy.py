@@ -0,0 +1,34 @@
+"""
+Carregamento sob demanda (PEP 562) dos módulos e classes de cada pacote,
+assim o processo só importa os padrões que de fato utiliza.
+"""
+
+
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+
+def attach(package: str, modules: Sequence[str],
+           exports: Dict[str, str]) -> Tuple[Callable, Callable, List[str]]:
+    """
+    Retorna o __getattr__, o __dir__ e o __all__ do pacote. Os módulos são
+    importados no primeiro acesso a eles ou a uma das classes exportadas.
+    """
+    __all__ = sorted([*modules, *exports])
+
+    def __getattr__(name: str) -> Any:
+        if name in modules:
+            return import_module(f'.{name}', package)
+
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(import_module(f'.{module}', package), name)
+        setattr(import_module(package), name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return __all__
+
+    return __getattr__, __dir__, __all__